@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from infrastructure.db import SessionLocal, engine  # noqa: E402
+from infrastructure.db_indexes import (  # noqa: E402
+    AUTOVACUUM_TUNED_TABLES,
+    IndexManager,
+    verify_performance_indexes,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Create or verify performance indexes outside the API process."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "bootstrap",
+        help="Create missing indexes concurrently and tune table autovacuum.",
+    )
+    subparsers.add_parser("verify", help="Report which indexes exist (no DDL).")
+    return parser
+
+
+async def _run(command: str) -> dict[str, bool]:
+    try:
+        async with SessionLocal() as session:  # pyright: ignore[reportGeneralTypeIssues]
+            if command == "bootstrap":
+                index_manager = IndexManager(session, engine)
+                results = await index_manager.create_performance_indexes()
+                for table_name in AUTOVACUUM_TUNED_TABLES:
+                    results[f"autovacuum:{table_name}"] = (
+                        await index_manager.tune_autovacuum(table_name)
+                    )
+                return results
+            if command == "verify":
+                return await verify_performance_indexes(session)
+            raise SystemExit(f"Unknown command: {command}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    results = asyncio.run(_run(args.command))
+    print(json.dumps(results, indent=2))
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import logging
 import time
 import uuid
@@ -20,8 +22,9 @@ from api.routes.history import router as history_router
 from api.routes.monte_carlo import router as monte_carlo_router
 from api.routes.performance import router as performance_router
 from core.logging import REQUEST_ID, setup_logging
-from infrastructure.db import engine, init_db
+from infrastructure.db import engine, init_db, sample_pool_status
 from infrastructure.monitoring import monitoring_service
+from infrastructure.orjson_response import ORJSONResponse
 from services.mc_backtest_service import DEFAULT_PARALLEL_WORKERS
 
 load_dotenv()
@@ -54,11 +57,20 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             )
 
     monitoring_service.register_health_check("database", db_health_check)
+    pool_sampler = asyncio.create_task(sample_pool_status())
     yield
+    pool_sampler.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await pool_sampler
     app_logger.info("Shutdown")
 
 
-app = FastAPI(title="Trading Backtest API", version="0.1.0", lifespan=app_lifespan)
+app = FastAPI(
+    title="Trading Backtest API",
+    version="0.1.0",
+    lifespan=app_lifespan,
+    default_response_class=ORJSONResponse,
+)
 allowed_origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
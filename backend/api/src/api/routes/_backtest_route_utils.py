@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
 import pandas as pd
@@ -55,6 +56,22 @@ def _parse_date_input(value: str | datetime) -> datetime:
         ) from e
 
 
+@lru_cache(maxsize=len(SYMBOL_TO_FILE))
+def _read_local_dataset(file_path: str) -> pd.DataFrame | None:
+    """Parse a bundled dataset once; None when it has no date column.
+
+    The datasets ship with the image and never change at runtime, so every
+    request for the same symbol shares one parsed frame. Callers only ever
+    get the boolean-masked copy, never the cached frame itself.
+    """
+    df = pd.read_csv(file_path)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    if "date" not in df.columns:
+        return None
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
 def load_filtered_local_dataset_df(
     symbol: str,
     start_date: str | datetime,
@@ -78,9 +95,8 @@ def load_filtered_local_dataset_df(
             detail=f"Dataset file not found for symbol {symbol}",
         )
 
-    df = pd.read_csv(file_path)
-    df.columns = [str(c).strip().lower() for c in df.columns]
-    if "date" not in df.columns:
+    df = _read_local_dataset(file_path)
+    if df is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Dataset file for {symbol} does not contain a date column",
@@ -88,7 +104,6 @@ def load_filtered_local_dataset_df(
 
     start_dt = _parse_date_input(start_date)
     end_dt = _parse_date_input(end_date)
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
     mask = (df["date"] >= start_dt) & (df["date"] <= end_dt)
     filtered_df = df.loc[mask]
     if filtered_df.empty:
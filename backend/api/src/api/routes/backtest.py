@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from collections.abc import Sequence
@@ -15,6 +16,7 @@ from core.simple_auth import (
     get_current_user_simple_optional,
 )
 from domain.schemas.backtest import (
+    BACKTEST_RESPONSE_ADAPTER,
     AggregatedMetrics,
     BacktestResponse,
     MultiBacktestResponse,
@@ -22,6 +24,7 @@ from domain.schemas.backtest import (
     SingleBacktestResult,
 )
 from infrastructure.db import get_session
+from infrastructure.orjson_response import ORJSONResponse
 from infrastructure.repositories.backtest_history_repository import (
     BacktestHistoryRepository,
 )
@@ -82,7 +85,7 @@ async def backtest_get(
     normalize: bool = Query(
         False, description="Normalize equity curve to start at 1.0"
     ),
-):
+) -> ORJSONResponse:
     """
     Run backtest using local datasets with Monte Carlo simulation support.
     This endpoint allows running backtests on local datasets without file upload.
@@ -118,8 +121,8 @@ async def backtest_get(
         normalize=normalize,
     )
     elapsed_time = time.time() - start_time
-    result.processing_time = f"{elapsed_time:.2f}s"
-    return result
+    result = result.model_copy(update={"processing_time": f"{elapsed_time:.2f}s"})
+    return ORJSONResponse(BACKTEST_RESPONSE_ADAPTER.dump_python(result))
 
 
 @router.post("/backtest", response_model=BacktestResponse)
@@ -158,7 +161,7 @@ async def backtest_post(
     csv: list[UploadFile] = File(default=[]),
     current_user: SimpleUser | None = Depends(get_current_user_simple_optional),
     session: AsyncSession = Depends(get_session),
-):
+) -> ORJSONResponse:
     """
     Run backtest with Monte Carlo simulation support.
     Supports both CSV file upload and local dataset usage.
@@ -207,7 +210,7 @@ async def backtest_post(
         normalize=normalize,
     )
     elapsed_time = time.time() - start_time
-    result.processing_time = f"{elapsed_time:.2f}s"
+    result = result.model_copy(update={"processing_time": f"{elapsed_time:.2f}s"})
     if current_user:
         try:
             user_repo = UserRepository(session)
@@ -260,7 +263,7 @@ async def backtest_post(
                     )
         except Exception as e:
             logger.warning(f"Failed to save backtest to history: {e}")
-    return result
+    return ORJSONResponse(BACKTEST_RESPONSE_ADAPTER.dump_python(result))
 
 
 async def run_regular_backtest(
@@ -275,12 +278,17 @@ async def run_regular_backtest(
     for file in files:
         try:
             source = CsvBytesPriceSeriesSource(await file.read(), price_type)
+            # Strategy runs are CPU-bound; keep them off the event loop.
             if strategy in {"sma_crossover", "sma"}:
-                result = run_sma_crossover(
-                    source, strategy_params["sma_short"], strategy_params["sma_long"]
+                result = await asyncio.to_thread(
+                    run_sma_crossover,
+                    source,
+                    strategy_params["sma_short"],
+                    strategy_params["sma_long"],
                 )
             elif strategy in {"rsi", "rsi_reversion"}:
-                result = run_rsi(
+                result = await asyncio.to_thread(
+                    run_rsi,
                     source,
                     strategy_params["period"],
                     strategy_params["overbought"],
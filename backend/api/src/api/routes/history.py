@@ -14,6 +14,7 @@ from domain.schemas.history import (
     UserStatsResponse,
 )
 from infrastructure.db import get_session
+from infrastructure.orjson_response import ORJSONResponse
 from infrastructure.repositories.backtest_history_repository import (
     BacktestHistoryRepository,
 )
@@ -42,7 +43,7 @@ async def get_user_history(
     current_user: SimpleUser = Depends(get_current_user_simple),
     user_repo: UserRepository = Depends(get_user_repo),
     history_repo: BacktestHistoryRepository = Depends(get_history_repo),
-):
+) -> ORJSONResponse:
     """Get user's backtest history with pagination."""
     user = await user_repo.get_by_id(current_user.id)
     if not user:
@@ -50,22 +51,16 @@ async def get_user_history(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
     offset = (page - 1) * per_page
-    total = await history_repo.count_user_history(
-        user_id=user.id,
-        strategy_filter=strategy,
-    )
-    items = await history_repo.get_user_history(
+    items, total = await history_repo.get_user_history_page(
         user_id=user.id,
-        limit=per_page + 1,
+        limit=per_page,
         offset=offset,
         strategy_filter=strategy,
     )
-    has_next = len(items) > per_page
-    if has_next:
-        items = items[:-1]
+    has_next = offset + len(items) < total
     has_prev = page > 1
-    response_items = [BacktestHistoryResponse.model_validate(item) for item in items]
-    return BacktestHistoryList(
+    response_items = [BacktestHistoryResponse.from_row(item) for item in items]
+    history_list = BacktestHistoryList.model_construct(
         items=response_items,
         total=total,
         page=page,
@@ -73,6 +68,7 @@ async def get_user_history(
         has_next=has_next,
         has_prev=has_prev,
     )
+    return ORJSONResponse(history_list.model_dump())
 
 
 @router.get("/stats", response_model=UserStatsResponse)
@@ -80,7 +76,7 @@ async def get_user_stats(
     current_user: SimpleUser = Depends(get_current_user_simple),
     user_repo: UserRepository = Depends(get_user_repo),
     history_repo: BacktestHistoryRepository = Depends(get_history_repo),
-):
+) -> ORJSONResponse:
     """Get user's backtest statistics."""
     user = await user_repo.get_by_id(current_user.id)
     if not user:
@@ -88,7 +84,7 @@ async def get_user_stats(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
     stats = await history_repo.get_user_stats(user.id)
-    return UserStatsResponse(**stats)
+    return ORJSONResponse(UserStatsResponse(**stats).model_dump())
 
 
 @router.get("/{history_id}", response_model=BacktestHistoryResponse)
@@ -97,7 +93,7 @@ async def get_history_detail(
     current_user: SimpleUser = Depends(get_current_user_simple),
     user_repo: UserRepository = Depends(get_user_repo),
     history_repo: BacktestHistoryRepository = Depends(get_history_repo),
-):
+) -> ORJSONResponse:
     """Get detailed information about a specific backtest."""
     user = await user_repo.get_by_id(current_user.id)
     if not user:
@@ -109,7 +105,7 @@ async def get_history_detail(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Backtest history not found"
         )
-    return BacktestHistoryResponse.model_validate(history)
+    return ORJSONResponse(BacktestHistoryResponse.from_row(history).model_dump())
 
 
 @router.put("/{history_id}/results", response_model=BacktestHistoryResponse)
@@ -119,7 +115,7 @@ async def update_backtest_results(
     current_user: SimpleUser = Depends(get_current_user_simple),
     user_repo: UserRepository = Depends(get_user_repo),
     history_repo: BacktestHistoryRepository = Depends(get_history_repo),
-):
+) -> ORJSONResponse:
     """Update backtest results (typically called by the system after completion)."""
     user = await user_repo.get_by_id(current_user.id)
     if not user:
@@ -138,7 +134,9 @@ async def update_backtest_results(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this backtest",
         )
-    return BacktestHistoryResponse.model_validate(updated_history)
+    return ORJSONResponse(
+        BacktestHistoryResponse.from_row(updated_history).model_dump()
+    )
 
 
 @router.delete("/{history_id}")
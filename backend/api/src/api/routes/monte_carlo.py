@@ -5,6 +5,7 @@ Monte Carlo simulation API endpoints.
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
@@ -29,6 +30,7 @@ from api.routes._backtest_route_utils import (
 from core.logging import JOB_ID
 from core.simple_auth import SimpleUser, get_current_user_simple_optional
 from infrastructure.db import get_session
+from infrastructure.orjson_response import ORJSONResponse, dumps
 from infrastructure.repositories.backtest_history_repository import (
     BacktestHistoryRepository,
 )
@@ -39,6 +41,7 @@ from utils.date_validation import (
     validate_date_range_for_csv_bytes,
     validate_date_range_for_symbol,
 )
+from workers.simple_worker import WorkerSaturatedError
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/monte-carlo", tags=["monte-carlo"])
@@ -89,8 +92,7 @@ async def _best_effort_create_async_job_record(
 ) -> None:
     try:
         repo = JobRepository(session)
-        existing = await repo.get_job_by_id(job_id)
-        if existing:
+        if await repo.job_exists(job_id):
             return
         await repo.create_job(
             job_id=job_id,
@@ -113,52 +115,62 @@ async def _best_effort_create_async_job_record(
         )
 
 
+# Last snapshot mirrored per job, so repeated polls of an unchanged job skip the DB.
+_mirrored_snapshots: OrderedDict[str, tuple[Any, ...]] = OrderedDict()
+_MAX_MIRRORED_SNAPSHOTS = 1024
+
+
 async def _best_effort_mirror_runtime_job_status(
     session: AsyncSession, job_status: dict[str, Any]
 ) -> None:
     job_id = str(job_status.get("job_id", ""))
     if not job_id:
         return
+    snapshot = (
+        job_status.get("status"),
+        job_status.get("progress"),
+        job_status.get("error"),
+        job_status.get("result") is not None,
+    )
+    if _mirrored_snapshots.get(job_id) == snapshot:
+        return
     try:
         repo = JobRepository(session)
-        existing = await repo.get_job_by_id(job_id)
+        exists = await repo.job_exists(job_id)
         payload_patch: dict[str, Any] = {
             key: job_status[key]
             for key in ("runs", "filename", "result")
             if key in job_status and job_status[key] is not None
         }
-        if not existing:
+        db_status = _db_status_from_runtime(job_status.get("status"))
+        if not exists:
             await repo.create_job(
                 job_id=job_id,
-                status=_db_status_from_runtime(job_status.get("status")),
+                status=db_status,
                 payload={
                     "job_type": "monte_carlo_async",
                     **payload_patch,
                 },
             )
-        elif payload_patch:
-            await repo.merge_job_payload(job_id, payload_patch)
 
-        started_at = _parse_iso_datetime(job_status.get("started_at"))
-        completed_at = _parse_iso_datetime(job_status.get("completed_at"))
         progress = (
             float(job_status["progress"])
             if isinstance(job_status.get("progress"), (float, int))
             else 0.0
         )
-        await repo.update_job_progress(
+        if await repo.apply_runtime_snapshot(
             job_id=job_id,
+            status=db_status,
             progress=progress,
-            started_at=started_at,
-            completed_at=completed_at,
-        )
-        await repo.update_job_status(
-            job_id=job_id,
-            status=_db_status_from_runtime(job_status.get("status")),
+            payload_patch=payload_patch if exists else None,
             error=job_status.get("error"),
-            progress=progress,
-            completed_at=completed_at,
-        )
+            started_at=_parse_iso_datetime(job_status.get("started_at")),
+            completed_at=_parse_iso_datetime(job_status.get("completed_at")),
+        ):
+            _mirrored_snapshots[job_id] = snapshot
+            _mirrored_snapshots.move_to_end(job_id)
+            if len(_mirrored_snapshots) > _MAX_MIRRORED_SNAPSHOTS:
+                _mirrored_snapshots.popitem(last=False)
     except Exception as e:
         logger.warning(
             "Failed to mirror runtime job status to database",
@@ -225,7 +237,7 @@ async def run_monte_carlo_sync(
     file: UploadFile | None = File(None),
     current_user: SimpleUser | None = Depends(get_current_user_simple_optional),
     session: AsyncSession = Depends(get_session),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Run Monte Carlo simulation synchronously.
     This endpoint executes the simulation immediately and returns results.
@@ -297,7 +309,9 @@ async def run_monte_carlo_sync(
         )
 
         strategy_name = strategy_params_dict.get("strategy", "sma_crossover")
-        result = run_monte_carlo_on_df(
+        # CPU-bound; run off the event loop so other requests keep flowing.
+        result = await asyncio.to_thread(
+            run_monte_carlo_on_df,
             csv_data=csv_bytes,
             filename=file.filename if file else f"{symbol}.csv",  # pyright: ignore[reportArgumentType]
             strategy_name=strategy_name,  # pyright: ignore[reportArgumentType]
@@ -311,28 +325,14 @@ async def run_monte_carlo_sync(
             price_type=price_type,
             parallel_workers=DEFAULT_PARALLEL_WORKERS,
         )
-        from domain.schemas.backtest import MonteCarloBacktestResult, MonteCarloResponse
+        from domain.schemas.backtest import (
+            MONTE_CARLO_RESP_ADAPTER,
+            MonteCarloBacktestResult,
+            MonteCarloResponse,
+        )
 
         if normalize and result.equity_envelope:
-            envelope = result.equity_envelope
-
-            def normalize_series(series: list[float]) -> list[float]:
-                if not series or series[0] == 0:
-                    return series
-                first_value = series[0]
-                return [value / first_value for value in series]
-
-            from domain.schemas.backtest import EquityEnvelope
-
-            normalized_envelope = EquityEnvelope(
-                timestamps=envelope.timestamps,
-                p5=normalize_series(envelope.p5),
-                p25=normalize_series(envelope.p25),
-                median=normalize_series(envelope.median),
-                p75=normalize_series(envelope.p75),
-                p95=normalize_series(envelope.p95),
-            )
-            result.equity_envelope = normalized_envelope
+            result.equity_envelope = result.equity_envelope.normalized()
 
         monte_carlo_result = MonteCarloBacktestResult(
             filename=result.filename,
@@ -400,7 +400,7 @@ async def run_monte_carlo_sync(
                 logger.warning(
                     f"Failed to save Monte Carlo simulation to history: {str(e)}"
                 )
-        return response.model_dump()
+        return ORJSONResponse(MONTE_CARLO_RESP_ADAPTER.dump_python(response))
     except HTTPException:
         raise
     except Exception as e:
@@ -540,6 +540,10 @@ async def submit_async_job(
         }
     except HTTPException:
         raise
+    except WorkerSaturatedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        ) from e
     except Exception as e:
         logger.error(
             "Failed to submit async job", extra={"symbol": symbol, "error": str(e)}
@@ -695,20 +699,27 @@ async def websocket_job_progress(websocket: WebSocket, job_id: str):
         # get_job_status est synchrone; ne pas utiliser await ici
         job_status = worker.get_job_status(job_id)
         if job_status:
-            await websocket.send_json(job_status)
+            await websocket.send_text(dumps(job_status).decode())
         else:
-            await websocket.send_json(
-                {"job_id": job_id, "status": "not_found", "error": "Job not found"}
+            await websocket.send_text(
+                dumps(
+                    {"job_id": job_id, "status": "not_found", "error": "Job not found"}
+                ).decode()
             )
             return
+        last_sent = (job_status["status"], job_status["progress"])
         while True:
             try:
                 job_status = worker.get_job_status(job_id)
-                if job_status:
-                    await websocket.send_json(job_status)
-                    if job_status.get("status") in ["completed", "failed", "cancelled"]:
-                        break
-                else:
+                if not job_status:
+                    break
+                current = (job_status["status"], job_status["progress"])
+                # Only push frames that carry a change; polls that see the same
+                # status/progress cost no encoding or socket write.
+                if current != last_sent:
+                    await websocket.send_text(dumps(job_status).decode())
+                    last_sent = current
+                if current[0] in ("completed", "failed", "cancelled"):
                     break
                 await asyncio.sleep(1)
             except Exception as e:
@@ -716,9 +727,8 @@ async def websocket_job_progress(websocket: WebSocket, job_id: str):
                     "Error in WebSocket progress monitoring",
                     extra={"job_id": job_id, "error": str(e)},
                 )
-                await websocket.send_json(
-                    {"job_id": job_id, "status": "error", "error": str(e)}
-                )
+                error_frame = {"job_id": job_id, "status": "error", "error": str(e)}
+                await websocket.send_text(dumps(error_frame).decode())
                 break
     except Exception as e:
         logger.error(
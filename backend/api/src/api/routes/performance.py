@@ -7,12 +7,16 @@ cache statistics, and system metrics.
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.db import get_pool_status, get_session
-from infrastructure.db_indexes import IndexManager, analyze_database_performance
+from infrastructure.db_indexes import (
+    IndexManager,
+    analyze_database_performance,
+    verify_performance_indexes,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/performance", tags=["performance"])
@@ -129,12 +133,15 @@ async def get_performance_metrics(
 
 @router.post("/database/optimize/{table_name}")
 async def optimize_table(
-    table_name: str, session: AsyncSession = Depends(get_session)
+    table_name: str,
+    full: bool = Query(False, description="Also VACUUM the table (bloat recovery)"),
+    session: AsyncSession = Depends(get_session),
 ) -> dict[str, Any]:
     """
     Optimize a specific database table.
     Args:
         table_name: Name of the table to optimize
+        full: Also run VACUUM instead of only refreshing statistics
     Returns:
         Optimization results
     """
@@ -146,7 +153,7 @@ async def optimize_table(
                 detail=f"Table '{table_name}' is not allowed for optimization",
             )
         index_manager = IndexManager(session)
-        result = await index_manager.optimize_table(table_name)
+        result = await index_manager.optimize_table(table_name, full=full)
         logger.info(
             "Table optimization completed",
             extra={"table_name": table_name, "success": result.get("success", False)},
@@ -165,38 +172,30 @@ async def optimize_table(
         ) from e
 
 
-@router.post("/database/create-indexes")
-async def create_performance_indexes(
+@router.get("/database/indexes")
+async def get_performance_indexes(
     session: AsyncSession = Depends(get_session),
 ) -> dict[str, Any]:
     """
-    Create performance-optimized database indexes.
+    Report which performance indexes exist.
+    Index creation is not done on the request path; run
+    ``python scripts/db_indexes_cli.py bootstrap`` to create missing ones.
     Returns:
-        Index creation results
+        Index presence by name
     """
     try:
-        index_manager = IndexManager(session)
-        results = await index_manager.create_performance_indexes()
-        success_count = sum(1 for success in results.values() if success)
-        total_count = len(results)
-        logger.info(
-            "Performance indexes creation completed",
-            extra={
-                "success_count": success_count,
-                "total_count": total_count,
-                "results": results,
-            },
-        )
+        results = await verify_performance_indexes(session)
+        present_count = sum(1 for present in results.values() if present)
         return {
-            "success": True,
-            "message": f"Created {success_count}/{total_count} indexes successfully",
+            "success": present_count == len(results),
+            "message": f"{present_count}/{len(results)} performance indexes present",
             "results": results,
         }
     except Exception as e:
-        logger.error("Failed to create performance indexes", extra={"error": str(e)})
+        logger.error("Failed to verify performance indexes", extra={"error": str(e)})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create performance indexes",
+            detail="Failed to verify performance indexes",
         ) from e
 
 
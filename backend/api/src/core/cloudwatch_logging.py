@@ -114,10 +114,15 @@ def setup_enhanced_logging_with_cloudwatch():
         if cloudwatch_handler:
             root_logger = logging.getLogger()
             root_logger.addHandler(cloudwatch_handler)
-            from core.logging import RequestIdFilter, SecretsFilter
+            from core.logging import (
+                RequestIdFilter,
+                SecretsFilter,
+                log_redaction_enabled,
+            )
 
             cloudwatch_handler.addFilter(RequestIdFilter())
-            cloudwatch_handler.addFilter(SecretsFilter())
+            if log_redaction_enabled():
+                cloudwatch_handler.addFilter(SecretsFilter())
             logging.getLogger("app").info("Enhanced logging with CloudWatch enabled")
         else:
             logging.getLogger("app").warning(
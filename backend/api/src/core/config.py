@@ -55,6 +55,10 @@ class Settings(BaseSettings):
     db_query_timeout: int = Field(
         default=30, description="Default query timeout in seconds"
     )
+    db_prepared_statement_cache_size: int = Field(
+        default=512,
+        description="Prepared statements cached per pooled connection (0 disables)",
+    )
     redis_url: str = Field(
         default="redis://localhost:6379/0", description="Redis connection URL"
     )
@@ -6,6 +6,8 @@ import sys
 from datetime import UTC, datetime
 from logging.handlers import RotatingFileHandler
 
+import orjson
+
 DEFAULT_LOG_RECORD_ATTRS = {
     "name",
     "msg",
@@ -42,20 +44,23 @@ class JSONFormatter(logging.Formatter):
             "logger": display_logger,
             "message": record.getMessage(),
         }
-        context = {}
-        for key, value in getattr(record, "__dict__", {}).items():
-            if key in DEFAULT_LOG_RECORD_ATTRS or key in payload or key.startswith("_"):
-                continue
-            if key == "color_message":
-                continue
-            try:
-                json.dumps(value)
-                context[key] = value
-            except Exception:
-                context[key] = str(value)
+        context = {
+            key: value
+            for key, value in getattr(record, "__dict__", {}).items()
+            if key not in DEFAULT_LOG_RECORD_ATTRS
+            and key not in payload
+            and not key.startswith("_")
+            and key != "color_message"
+        }
         if context:
             payload["context"] = context  # pyright: ignore[reportArgumentType]
-        return json.dumps(payload, ensure_ascii=False)
+        # Values orjson cannot encode natively fall back to str() via default.
+        try:
+            return orjson.dumps(
+                payload, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(payload, ensure_ascii=False, default=str)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -79,18 +84,13 @@ class ConsoleFormatter(logging.Formatter):
         display_logger = "uvicorn" if record.name == "uvicorn.error" else record.name
         prefix = f"[{ts}] {color}{level}{self.RESET} {display_logger}: "
         message = record.getMessage()
-        extras = []
-        for key, value in getattr(record, "__dict__", {}).items():
-            if key in DEFAULT_LOG_RECORD_ATTRS or key.startswith("_"):
-                continue
-            if key == "color_message":
-                continue
-            try:
-                json.dumps(value)
-                val = value
-            except Exception:
-                val = str(value)
-            extras.append(f"{key}={val}")
+        extras = [
+            f"{key}={value}"
+            for key, value in getattr(record, "__dict__", {}).items()
+            if key not in DEFAULT_LOG_RECORD_ATTRS
+            and not key.startswith("_")
+            and key != "color_message"
+        ]
         suffix = f" {' '.join(extras)}" if extras else ""
         return f"{prefix}{message}{suffix}"
 
@@ -185,8 +185,6 @@ def _redact(value):
 
 class SecretsFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        if os.getenv("DISABLE_LOG_REDACTION", "false").lower() == "true":
-            return True
         for key in list(getattr(record, "__dict__", {}).keys()):
             if key.lower() in SENSITIVE_KEYS:
                 setattr(record, key, "[REDACTED]")
@@ -200,6 +198,10 @@ class SecretsFilter(logging.Filter):
         return True
 
 
+def log_redaction_enabled() -> bool:
+    return os.getenv("DISABLE_LOG_REDACTION", "false").lower() != "true"
+
+
 def setup_logging():
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
@@ -208,6 +210,8 @@ def setup_logging():
     for h in list(root.handlers):
         root.removeHandler(h)
     log_format = os.getenv("LOG_FORMAT", "json").lower()
+    # Decided once here so handlers carry no per-record environment lookup.
+    redact = log_redaction_enabled()
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(level)
     if log_format == "console":
@@ -216,7 +220,8 @@ def setup_logging():
         handler.setFormatter(JSONFormatter())
     handler.addFilter(RequestIdFilter())
     handler.addFilter(JobIdFilter())
-    handler.addFilter(SecretsFilter())
+    if redact:
+        handler.addFilter(SecretsFilter())
     root.addHandler(handler)
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         lg = logging.getLogger(name)
@@ -236,6 +241,7 @@ def setup_logging():
             file_handler.setFormatter(JSONFormatter())
         file_handler.addFilter(RequestIdFilter())
         file_handler.addFilter(JobIdFilter())
-        file_handler.addFilter(SecretsFilter())
+        if redact:
+            file_handler.addFilter(SecretsFilter())
         root.addHandler(file_handler)
     logging.getLogger("app").info("Logging initialized", extra={"level": level_name})
@@ -3,16 +3,20 @@ Simple JWT authentication system for local development.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from pydantic import BaseModel
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import get_settings
 from infrastructure.db import get_session
+from infrastructure.models import User
 from infrastructure.repositories.users import get_user_by_id
 
 logger = logging.getLogger(__name__)
@@ -57,6 +61,43 @@ def get_simple_auth_service() -> SimpleAuthService:
     return simple_auth_service
 
 
+# Authenticated users resolved recently, so a burst of API calls from one
+# client does not re-read the same users row on every request.
+_user_cache: OrderedDict[int, tuple[float, SimpleUser]] = OrderedDict()
+_MAX_CACHED_USERS = 1024
+USER_CACHE_TTL_SECONDS = 60.0
+
+
+async def _load_simple_user(db: AsyncSession, user_id: int) -> SimpleUser | None:
+    """Resolve a token subject to a SimpleUser, served from cache within the TTL."""
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached is not None and now - cached[0] < USER_CACHE_TTL_SECONDS:
+        return cached[1]
+    user = await get_user_by_id(db, user_id)
+    if not user:
+        _user_cache.pop(user_id, None)
+        return None
+    simple_user = SimpleUser(id=user.id, email=user.email, sub=str(user.id))
+    _user_cache[user_id] = (now, simple_user)
+    _user_cache.move_to_end(user_id)
+    if len(_user_cache) > _MAX_CACHED_USERS:
+        _user_cache.popitem(last=False)
+    return simple_user
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the auth cache so the next request re-reads the row."""
+    _user_cache.pop(user_id, None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_changed_user(_mapper: Any, _connection: Any, target: User) -> None:
+    # Any ORM update or delete of a users row, whichever repository issued it.
+    invalidate_cached_user(target.id)
+
+
 async def get_current_user_simple(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: SimpleAuthService = Depends(get_simple_auth_service),
@@ -93,14 +134,14 @@ async def get_current_user_simple(
             detail="Invalid token payload",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = await get_user_by_id(db, int(user_id))
+    user = await _load_simple_user(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return SimpleUser(id=user.id, email=user.email, sub=str(user.id))
+    return user
 
 
 async def get_current_user_simple_optional(
@@ -128,13 +169,13 @@ async def get_current_user_simple_optional(
         logger.warning("Invalid token payload, continuing without authentication")
         return None
     try:
-        user = await get_user_by_id(db, int(user_id))
+        user = await _load_simple_user(db, int(user_id))
         if not user:
             logger.warning(
                 "User not found in database, continuing without authentication"
             )
             return None
-        return SimpleUser(id=user.id, email=user.email, sub=str(user.id))
+        return user
     except Exception as e:
         logger.warning(
             f"Error retrieving user from database: {e}, continuing without authentication"
@@ -1,31 +1,231 @@
-from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING, Annotated, Any, Literal, overload
+
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    model_validator,
+)
+from pydantic.json_schema import SkipJsonSchema
+
+# Row order of EquityEnvelope.bands and the percentile levels they hold.
+ENVELOPE_BANDS = ("p5", "p25", "median", "p75", "p95")
+ENVELOPE_PERCENTILES = (5, 25, 50, 75, 95)
+# Order of MetricsDistribution.stats.
+METRIC_STATS = ("mean", "std", *ENVELOPE_BANDS)
 
 
 class MetricsDistribution(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    """Summary statistics stored as one (7,) float64 array.
+
+    Values are ordered as METRIC_STATS; the named fields are only
+    materialized when the model is dumped.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True, arbitrary_types_allowed=True)
+
+    stats: SkipJsonSchema[np.ndarray] = Field(exclude=True, repr=False)
+
+    # frozen=True would derive a hash from the ndarray field, which has none.
+    __hash__ = None
+
+    if TYPE_CHECKING:
+
+        @overload
+        def __init__(self, *, stats: np.ndarray) -> None: ...
+        @overload
+        def __init__(
+            self,
+            *,
+            mean: float,
+            std: float,
+            p5: float,
+            p25: float,
+            median: float,
+            p75: float,
+            p95: float,
+        ) -> None: ...
+        def __init__(self, **data: Any) -> None: ...
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_stats(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        if "stats" in data:
+            # Copy, so freezing below never touches the caller's array.
+            stats = np.array(data["stats"], dtype=np.float64)
+        else:
+            missing = [name for name in METRIC_STATS if name not in data]
+            if missing:
+                raise ValueError(f"Missing metrics distribution fields: {missing}")
+            stats = np.asarray(
+                [data.pop(name) for name in METRIC_STATS], dtype=np.float64
+            )
+        if stats.shape != (len(METRIC_STATS),):
+            raise ValueError("Metrics distribution stats must have shape (7,)")
+        stats.flags.writeable = False
+        data["stats"] = stats
+        return data
+
+    @classmethod
+    def from_values(cls, values: Any) -> "MetricsDistribution":
+        """Summarize a sample with a single percentile pass."""
+        arr = np.asarray(values, dtype=np.float64)
+        stats = np.empty(len(METRIC_STATS), dtype=np.float64)
+        stats[0] = arr.mean()
+        stats[1] = arr.std()
+        stats[2:] = np.percentile(arr, ENVELOPE_PERCENTILES)
+        return cls(stats=stats)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MetricsDistribution):
+            return NotImplemented
+        return np.array_equal(self.stats, other.stats)
+
+    def as_named_dict(self) -> dict[str, float]:
+        return dict(zip(METRIC_STATS, self.stats.tolist(), strict=True))
+
+    @computed_field
+    @property
+    def mean(self) -> float:
+        return float(self.stats[0])
+
+    @computed_field
+    @property
+    def std(self) -> float:
+        return float(self.stats[1])
+
+    @computed_field
+    @property
+    def p5(self) -> float:
+        return float(self.stats[2])
+
+    @computed_field
+    @property
+    def p25(self) -> float:
+        return float(self.stats[3])
 
-    mean: float
-    std: float
-    p5: float
-    p25: float
-    median: float
-    p75: float
-    p95: float
+    @computed_field
+    @property
+    def median(self) -> float:
+        return float(self.stats[4])
+
+    @computed_field
+    @property
+    def p75(self) -> float:
+        return float(self.stats[5])
+
+    @computed_field
+    @property
+    def p95(self) -> float:
+        return float(self.stats[6])
 
 
 class EquityEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    """Percentile envelope stored as one (5, T) float64 array.
+
+    The p5..p95 lists are only materialized when the model is dumped.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True, arbitrary_types_allowed=True)
 
     timestamps: list[str]
-    p5: list[float]
-    p25: list[float]
-    median: list[float]
-    p75: list[float]
-    p95: list[float]
+    bands: SkipJsonSchema[np.ndarray] = Field(exclude=True, repr=False)
+
+    __hash__ = None
+
+    if TYPE_CHECKING:
+
+        @overload
+        def __init__(self, *, timestamps: list[str], bands: np.ndarray) -> None: ...
+        @overload
+        def __init__(
+            self,
+            *,
+            timestamps: list[str],
+            p5: list[float],
+            p25: list[float],
+            median: list[float],
+            p75: list[float],
+            p95: list[float],
+        ) -> None: ...
+        def __init__(self, **data: Any) -> None: ...
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_bands(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        if "bands" in data:
+            # Copy, so freezing below never touches the caller's array.
+            bands = np.array(data["bands"], dtype=np.float64)
+        else:
+            missing = [name for name in ENVELOPE_BANDS if name not in data]
+            if missing:
+                raise ValueError(f"Missing equity envelope fields: {missing}")
+            bands = np.asarray(
+                [data.pop(name) for name in ENVELOPE_BANDS], dtype=np.float64
+            )
+        if bands.ndim != 2 or bands.shape[0] != len(ENVELOPE_BANDS):
+            raise ValueError("Equity envelope bands must have shape (5, T)")
+        n_cols = bands.shape[-1]
+        timestamps = data.get("timestamps")
+        # Zero-width bands are the empty envelope of a run set with no curves.
+        if isinstance(timestamps, list) and n_cols and n_cols != len(timestamps):
+            raise ValueError("Equity envelope needs one band column per timestamp")
+        bands.flags.writeable = False
+        data["bands"] = bands
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EquityEnvelope):
+            return NotImplemented
+        return self.timestamps == other.timestamps and np.array_equal(
+            self.bands, other.bands
+        )
+
+    @computed_field
+    @property
+    def p5(self) -> list[float]:
+        return self.bands[0].tolist()
+
+    @computed_field
+    @property
+    def p25(self) -> list[float]:
+        return self.bands[1].tolist()
+
+    @computed_field
+    @property
+    def median(self) -> list[float]:
+        return self.bands[2].tolist()
+
+    @computed_field
+    @property
+    def p75(self) -> list[float]:
+        return self.bands[3].tolist()
+
+    @computed_field
+    @property
+    def p95(self) -> list[float]:
+        return self.bands[4].tolist()
+
+    def normalized(self) -> "EquityEnvelope":
+        """Return a copy with every band rescaled to start at 1.0."""
+        if self.bands.shape[1] == 0:
+            return self
+        first = self.bands[:, :1]
+        scale = np.where(first == 0, 1.0, first)
+        return EquityEnvelope(timestamps=self.timestamps, bands=self.bands / scale)
 
 
 class SingleBacktestResult(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     filename: str
     timestamps: list[str]
@@ -36,7 +236,7 @@ class SingleBacktestResult(BaseModel):
 
 
 class MonteCarloBacktestResult(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     filename: str
     method: str
@@ -47,7 +247,7 @@ class MonteCarloBacktestResult(BaseModel):
 
 
 class AggregatedMetrics(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     average_pnl: float
     average_sharpe: float
@@ -56,8 +256,9 @@ class AggregatedMetrics(BaseModel):
 
 
 class SingleBacktestResponse(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+    kind: Literal["single"] = "single"
     timestamps: list[str]
     equity_curve: list[float]
     pnl: float
@@ -67,19 +268,33 @@ class SingleBacktestResponse(BaseModel):
 
 
 class MultiBacktestResponse(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+    kind: Literal["multi"] = "multi"
     results: list[SingleBacktestResult]
     aggregated_metrics: AggregatedMetrics | None = None
     processing_time: str | None = None
 
 
 class MonteCarloResponse(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+    kind: Literal["monte_carlo"] = "monte_carlo"
     results: list[MonteCarloBacktestResult]
     aggregated_metrics: AggregatedMetrics | None = None
     processing_time: str | None = None
 
 
-BacktestResponse = SingleBacktestResponse | MultiBacktestResponse | MonteCarloResponse
+BacktestResponse = Annotated[
+    SingleBacktestResponse | MultiBacktestResponse | MonteCarloResponse,
+    Field(discriminator="kind"),
+]
+
+# Validators/serializers are compiled once at import and reused by the routes.
+BACKTEST_RESPONSE_ADAPTER: TypeAdapter[BacktestResponse] = TypeAdapter(BacktestResponse)
+MULTI_RESP_ADAPTER: TypeAdapter[MultiBacktestResponse] = TypeAdapter(
+    MultiBacktestResponse
+)
+MONTE_CARLO_RESP_ADAPTER: TypeAdapter[MonteCarloResponse] = TypeAdapter(
+    MonteCarloResponse
+)
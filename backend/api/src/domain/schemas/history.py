@@ -2,7 +2,7 @@
 Pydantic schemas for backtest history.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -13,8 +13,8 @@ class BacktestHistoryCreate(BaseModel):
 
     strategy: str = Field(..., description="Strategy name")
     strategy_params: dict[str, Any] = Field(..., description="Strategy parameters")
-    start_date: str | None = Field(None, description="Backtest start date")
-    end_date: str | None = Field(None, description="Backtest end date")
+    start_date: date | None = Field(None, description="Backtest start date")
+    end_date: date | None = Field(None, description="Backtest end date")
     initial_capital: float = Field(10000.0, description="Initial capital")
     monte_carlo_runs: int = Field(1, description="Number of Monte Carlo runs")
     monte_carlo_method: str | None = Field(None, description="Monte Carlo method")
@@ -50,8 +50,8 @@ class BacktestHistoryResponse(BaseModel):
     user_id: int
     strategy: str
     strategy_params: dict[str, Any]
-    start_date: str | None
-    end_date: str | None
+    start_date: date | None
+    end_date: date | None
     initial_capital: float
     monte_carlo_runs: int
     monte_carlo_method: str | None
@@ -69,6 +69,16 @@ class BacktestHistoryResponse(BaseModel):
     created_at: datetime
     completed_at: datetime | None
 
+    @classmethod
+    def from_row(cls, row: Any) -> "BacktestHistoryResponse":
+        """Build from a trusted ORM row without re-running field validation."""
+        return cls.model_construct(
+            **{name: getattr(row, name) for name in _HISTORY_RESPONSE_FIELDS}
+        )
+
+
+_HISTORY_RESPONSE_FIELDS = tuple(BacktestHistoryResponse.model_fields)
+
 
 class BacktestHistoryList(BaseModel):
     model_config = ConfigDict(extra="forbid")
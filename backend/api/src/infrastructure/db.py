@@ -1,7 +1,8 @@
+import asyncio
 import logging
-from urllib.parse import urlparse
+import re
 
-from sqlalchemy import event
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.pool import AsyncAdaptedQueuePool
@@ -16,17 +17,23 @@ class Base(DeclarativeBase):
     pass
 
 
+_SYNC_PG_SCHEME_RE = re.compile(r"^postgresql(?:\+psycopg2?)?://")
+
+
 def _to_async_url(url: str) -> str:
     """Convert synchronous database URL to async format"""
-    parsed = urlparse(url)
-    if parsed.scheme.startswith("postgresql") and "+asyncpg" not in parsed.scheme:
-        return url.replace("postgresql+psycopg", "postgresql+asyncpg").replace(
-            "postgresql://", "postgresql+asyncpg://"
-        )
-    return url
+    return _SYNC_PG_SCHEME_RE.sub("postgresql+asyncpg://", url, count=1)
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON column values with orjson (SQLAlchemy expects a str)."""
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
 
 
 ASYNC_DB_URL = _to_async_url(settings.db_url)
+_REDACTED_DB_URL = re.sub(r"://[^@/]+@", "://[REDACTED]@", ASYNC_DB_URL, count=1)
 engine = create_async_engine(
     ASYNC_DB_URL,
     echo=settings.db_echo,
@@ -38,8 +45,11 @@ engine = create_async_engine(
     pool_pre_ping=settings.db_pool_pre_ping,
     poolclass=AsyncAdaptedQueuePool,
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     connect_args={
         "command_timeout": settings.db_query_timeout,
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
         "server_settings": {
             "jit": "off",
             "application_name": "trading_platform_api",
@@ -55,40 +65,12 @@ SessionLocal = sessionmaker(  # pyright: ignore[reportCallIssue, reportArgumentT
 )
 
 
-@event.listens_for(engine.sync_engine, "checkout")
-def receive_checkout(dbapi_connection, connection_record, connection_proxy):
-    """Log connection checkout for monitoring"""
-    logger.debug(
-        "Connection checked out from pool",
-        extra={
-            "pool_size": engine.pool.size(),  # pyright: ignore[reportAttributeAccessIssue]
-            "checked_out": engine.pool.checkedout(),  # pyright: ignore[reportAttributeAccessIssue]
-            "overflow": engine.pool.overflow(),  # pyright: ignore[reportAttributeAccessIssue]
-            "checked_in": engine.pool.checkedin(),  # pyright: ignore[reportAttributeAccessIssue]
-        },
-    )
-
-
-@event.listens_for(engine.sync_engine, "checkin")
-def receive_checkin(dbapi_connection, connection_record):
-    """Log connection checkin for monitoring"""
-    logger.debug(
-        "Connection returned to pool",
-        extra={
-            "pool_size": engine.pool.size(),  # pyright: ignore[reportAttributeAccessIssue]
-            "checked_out": engine.pool.checkedout(),  # pyright: ignore[reportAttributeAccessIssue]
-            "overflow": engine.pool.overflow(),  # pyright: ignore[reportAttributeAccessIssue]
-            "checked_in": engine.pool.checkedin(),  # pyright: ignore[reportAttributeAccessIssue]
-        },
-    )
-
-
 async def init_db() -> None:
     """Initialize database with performance monitoring"""
     logger.info(
         "Database initialized",
         extra={
-            "db_url": ASYNC_DB_URL.split("@")[0] + "@[REDACTED]",
+            "db_url": _REDACTED_DB_URL,
             "pool_size": settings.db_pool_size,
             "max_overflow": settings.db_max_overflow,
             "pool_timeout": settings.db_pool_timeout,
@@ -121,3 +103,11 @@ async def get_pool_status() -> dict:
         "checked_in": engine.pool.checkedin(),  # pyright: ignore[reportAttributeAccessIssue]
         "total_connections": engine.pool.size() + engine.pool.overflow(),  # pyright: ignore[reportAttributeAccessIssue]
     }
+
+
+async def sample_pool_status(interval: float = 5.0) -> None:
+    """Log pool occupancy periodically instead of on every checkout/checkin"""
+    while True:
+        await asyncio.sleep(interval)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Connection pool status", extra=await get_pool_status())
@@ -4,173 +4,261 @@ This module provides utilities for creating and managing database indexes
 to improve query performance for the trading platform.
 """
 
+import asyncio
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import Any, ClassVar
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import JSON, TextClause, bindparam, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.sql.selectable import TextualSelect
 
 logger = logging.getLogger(__name__)
 
+ALLOWED_TABLES = frozenset(
+    {"jobs", "users", "backtests", "strategies", "backtest_history", "alembic_version"}
+)
+TABLE_ANALYSIS_CONCURRENCY = 4
+# Per-table autovacuum settings for high-churn tables, so PostgreSQL vacuums
+# them in small increments instead of relying on manual VACUUM runs.
+AUTOVACUUM_TUNED_TABLES = ("jobs",)
+_AUTOVACUUM_OPTIONS = (
+    "autovacuum_vacuum_scale_factor = 0.05, "
+    "autovacuum_analyze_scale_factor = 0.02, "
+    "autovacuum_vacuum_cost_delay = 0"
+)
+
+_JOB_INDEXES: list[dict[str, str]] = [
+    {
+        "name": "idx_jobs_status_created_at",
+        "sql": """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_status_created_at
+            ON jobs (status, created_at DESC)
+        """,
+        "description": "Composite index for status filtering with time ordering",
+    },
+    {
+        "name": "idx_jobs_worker_status",
+        "sql": """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_worker_status
+            ON jobs (worker_id, status) WHERE worker_id IS NOT NULL
+        """,
+        "description": "Partial index for worker-specific job queries",
+    },
+    {
+        "name": "brin_jobs_created_at",
+        "sql": """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS brin_jobs_created_at
+            ON jobs USING brin (created_at) WITH (pages_per_range = 32)
+        """,
+        "description": "Block-range index for created_at time-range analytics",
+    },
+]
+_USER_INDEXES: list[dict[str, str]] = [
+    {
+        "name": "idx_users_created_at",
+        "sql": """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at
+            ON users (created_at DESC)
+        """,
+        "description": "Index for user registration analytics",
+    },
+]
+PERFORMANCE_INDEXES = _JOB_INDEXES + _USER_INDEXES
+
+# Statements are built once; only the allowlisted table name or the detected
+# pg_stat_statements column pair varies, and those are memoized below.
+_TABLE_STATS_SQL = text("""
+    SELECT
+        pg_size_pretty(pg_total_relation_size(c.oid)) AS total_size,
+        pg_size_pretty(pg_relation_size(c.oid)) AS table_size,
+        c.reltuples::bigint AS reltuples,
+        s.n_live_tup,
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'column', attname,
+                    'n_distinct', n_distinct,
+                    'correlation', correlation
+                )
+                ORDER BY attname
+            )
+            FROM pg_stats
+            WHERE tablename = :table_name
+        ) AS column_stats
+    FROM pg_class c
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE c.oid = CAST(:table_name AS regclass)
+""").columns(column_stats=JSON)
+
+_PGSS_PROBE_SQL = text("""
+    SELECT
+        EXISTS (
+            SELECT 1 FROM pg_extension
+            WHERE extname = 'pg_stat_statements'
+        ) AS installed,
+        EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = to_regclass('pg_stat_statements')
+              AND attname = 'total_exec_time'
+        ) AS has_exec_time
+""")
+
+_INDEX_USAGE_SQL = text("""
+    SELECT COALESCE(json_agg(q ORDER BY q.scans, q.size_bytes DESC), '[]'::json) AS items
+    FROM (
+        SELECT
+            s.schemaname AS schema,
+            s.relname AS "table",
+            s.indexrelname AS index,
+            s.idx_tup_read AS tuples_read,
+            s.idx_tup_fetch AS tuples_fetched,
+            s.idx_scan AS scans,
+            pg_relation_size(s.indexrelid) AS size_bytes
+        FROM pg_stat_user_indexes s
+        JOIN pg_index i ON i.indexrelid = s.indexrelid
+        WHERE NOT i.indisunique
+          AND (s.idx_scan = 0 OR pg_relation_size(s.indexrelid) > :min_size_bytes)
+        ORDER BY s.idx_scan ASC, size_bytes DESC
+        LIMIT :limit
+    ) q
+""").columns(items=JSON)
+
+_EXISTING_INDEXES_SQL = text("""
+    SELECT indexname
+    FROM pg_indexes
+    WHERE schemaname = current_schema()
+      AND indexname IN :names
+""").bindparams(bindparam("names", expanding=True))
+
+
+@lru_cache(maxsize=2)
+def _slow_queries_sql(total_col: str, mean_col: str) -> TextualSelect:
+    return text(f"""
+        SELECT COALESCE(json_agg(q ORDER BY q.total_time_ms DESC), '[]'::json) AS items
+        FROM (
+            SELECT
+                query,
+                calls,
+                {total_col}::float8 AS total_time_ms,
+                {mean_col}::float8 AS mean_time_ms,
+                rows,
+                COALESCE(
+                    100.0 * shared_blks_hit
+                    / nullif(shared_blks_hit + shared_blks_read, 0),
+                    0.0
+                )::float8 AS cache_hit_percent
+            FROM pg_stat_statements
+            WHERE calls >= :min_calls
+              AND query NOT LIKE '%pg_stat_statements%'
+            ORDER BY {total_col} DESC
+            LIMIT :limit
+        ) q
+    """).columns(items=JSON)
+
+
+@lru_cache(maxsize=32)
+def _table_sql(statement: str, quoted_table: str) -> TextClause:
+    return text(f"{statement} {quoted_table}")
+
 
 class IndexManager:
     """Manages database indexes for performance optimization"""
 
-    def __init__(self, session: AsyncSession):
+    # Extension availability does not change at runtime, so it is probed once
+    # per process rather than on every slow-query scrape.
+    _has_pgss: ClassVar[bool | None] = None
+    # pg_stat_statements 1.8 (PG13) renamed total_time/mean_time to *_exec_time.
+    _pgss_time_columns: ClassVar[tuple[str, str]] = ("total_time", "mean_time")
+
+    def __init__(self, session: AsyncSession, engine: AsyncEngine | None = None):
         self.session = session
+        if engine is None:
+            bind = session.bind
+            if not isinstance(bind, AsyncEngine):
+                raise TypeError(
+                    "IndexManager needs an AsyncEngine; pass engine= when the "
+                    "session is not bound to one"
+                )
+            engine = bind
+        self.engine: AsyncEngine = engine
+
+    @classmethod
+    def reset_extension_cache(cls) -> None:
+        """Forget the cached pg_stat_statements probe (e.g. after installing it)"""
+        cls._has_pgss = None
+        cls._pgss_time_columns = ("total_time", "mean_time")
+
+    def _quoted_table(self, table_name: str) -> str:
+        """Quote an allowlisted table name for statements that cannot bind it"""
+        if table_name not in ALLOWED_TABLES:
+            raise ValueError(f"Invalid table name: {table_name}")
+        return self.engine.dialect.identifier_preparer.quote(table_name)
 
     async def create_performance_indexes(self) -> dict[str, bool]:
         """
         Create performance-optimized indexes for frequently queried columns.
+        The DDL runs on its own autocommit connection from ``self.engine``;
+        ``self.session`` stays transactional for the other operations.
         Returns:
             Dictionary mapping index name to creation success status
         """
         results = {}
-        job_indexes = [
-            {
-                "name": "idx_jobs_status_created_at",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_status_created_at
-                    ON jobs (status, created_at DESC)
-                """,
-                "description": "Composite index for status filtering with time ordering",
-            },
-            {
-                "name": "idx_jobs_worker_status",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_worker_status
-                    ON jobs (worker_id, status) WHERE worker_id IS NOT NULL
-                """,
-                "description": "Partial index for worker-specific job queries",
-            },
-            {
-                "name": "idx_jobs_priority_created_at",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_priority_created_at
-                    ON jobs (priority, created_at) WHERE status IN ('pending', 'retry')
-                """,
-                "description": "Partial index for job queue ordering",
-            },
-            {
-                "name": "idx_jobs_dedup_key_hash",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_dedup_key_hash
-                    ON jobs USING hash (dedup_key) WHERE dedup_key IS NOT NULL
-                """,
-                "description": "Hash index for fast deduplication lookups",
-            },
-            {
-                "name": "idx_jobs_updated_at_status",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_updated_at_status
-                    ON jobs (updated_at DESC, status) WHERE status IN ('processing', 'completed', 'failed')
-                """,
-                "description": "Index for monitoring and cleanup queries",
-            },
-            {
-                "name": "idx_jobs_progress_processing",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_progress_processing
-                    ON jobs (progress, updated_at DESC) WHERE status = 'processing'
-                """,
-                "description": "Partial index for progress monitoring of processing jobs",
-            },
-        ]
-        user_indexes = [
-            {
-                "name": "idx_users_email_lower",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_lower
-                    ON users (LOWER(email))
-                """,
-                "description": "Case-insensitive email lookup index",
-            },
-            {
-                "name": "idx_users_created_at",
-                "sql": """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at
-                    ON users (created_at DESC)
-                """,
-                "description": "Index for user registration analytics",
-            },
-        ]
-        all_indexes = job_indexes + user_indexes
-        for index_config in all_indexes:
-            try:
-                await self.session.execute(text(index_config["sql"]))
-                await self.session.commit()
-                results[index_config["name"]] = True
-                logger.info(
-                    "Created database index",
-                    extra={
-                        "index_name": index_config["name"],
-                        "description": index_config["description"],
-                    },
-                )
-            except Exception as e:
-                await self.session.rollback()
-                results[index_config["name"]] = False
-                logger.error(
-                    "Failed to create database index",
-                    extra={"index_name": index_config["name"], "error": str(e)},
-                )
+        # CONCURRENTLY cannot run inside a transaction block (SQLSTATE 25001),
+        # so every index goes through one autocommit connection: no per-index
+        # commit, no extra pool checkouts, and one failure leaves the rest.
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for index_config in PERFORMANCE_INDEXES:
+                try:
+                    await conn.execute(text(index_config["sql"]))
+                    results[index_config["name"]] = True
+                    logger.info(
+                        "Created database index",
+                        extra={
+                            "index_name": index_config["name"],
+                            "description": index_config["description"],
+                        },
+                    )
+                except Exception as e:
+                    results[index_config["name"]] = False
+                    logger.error(
+                        "Failed to create database index",
+                        extra={"index_name": index_config["name"], "error": str(e)},
+                    )
         return results
 
-    async def analyze_table_statistics(self, table_name: str) -> dict[str, Any]:
+    async def analyze_table_statistics(
+        self, table_name: str, exact: bool = False
+    ) -> dict[str, Any]:
         """
         Analyze table statistics for query optimization.
         Args:
             table_name: Name of the table to analyze
+            exact: Run count(*) instead of reading the planner's row estimate
         Returns:
             Dictionary containing table statistics
         """
         try:
-            if not table_name.replace("_", "").isalnum():
-                raise ValueError(f"Invalid table name: {table_name}")
-            await self.session.execute(
-                text("ANALYZE :table_name").bindparam(table_name=table_name)  # pyright: ignore[reportAttributeAccessIssue]
+            quoted_table = self._quoted_table(table_name)
+            await self.session.execute(_table_sql("ANALYZE", quoted_table))
+            result = await self.session.execute(
+                _TABLE_STATS_SQL, {"table_name": table_name}
             )
-            stats_query = text("""
-                SELECT
-                    schemaname,
-                    tablename,
-                    attname,
-                    n_distinct,
-                    correlation
-                FROM pg_stats
-                WHERE tablename = :table_name
-                ORDER BY attname
-            """)
-            result = await self.session.execute(stats_query, {"table_name": table_name})
-            stats = result.fetchall()
-            size_query = text("""
-                SELECT
-                    pg_size_pretty(pg_total_relation_size(:table_name)) as total_size,
-                    pg_size_pretty(pg_relation_size(:table_name)) as table_size
-            """)
-            count_query = text(f"""
-                SELECT count(*) as row_count
-                FROM {table_name}
-            """)
-            size_result = await self.session.execute(
-                size_query, {"table_name": table_name}
-            )
-            count_result = await self.session.execute(count_query)
-            size_info = size_result.fetchone()
-            count_info = count_result.fetchone()
+            info = result.fetchone()
+            if exact:
+                count_result = await self.session.execute(
+                    _table_sql("SELECT count(*) AS row_count FROM", quoted_table)
+                )
+                row_count = count_result.scalar() or 0
+            else:
+                row_count = (info.n_live_tup or max(info.reltuples, 0)) if info else 0
             return {
                 "table_name": table_name,
-                "total_size": size_info.total_size if size_info else "Unknown",
-                "table_size": size_info.table_size if size_info else "Unknown",
-                "row_count": count_info.row_count if count_info else 0,
-                "column_stats": [
-                    {
-                        "column": stat.attname,
-                        "n_distinct": stat.n_distinct,
-                        "correlation": stat.correlation,
-                    }
-                    for stat in stats
-                ],
+                "total_size": info.total_size if info else "Unknown",
+                "table_size": info.table_size if info else "Unknown",
+                "row_count": row_count,
+                "column_stats": (info.column_stats if info else None) or [],
             }
         except Exception as e:
             logger.error(
@@ -179,79 +267,93 @@ class IndexManager:
             )
             return {"error": str(e)}
 
-    async def get_slow_queries(self, limit: int = 10) -> list[dict[str, Any]]:
+    async def get_slow_queries(
+        self, limit: int = 10, min_calls: int = 5
+    ) -> list[dict[str, Any]]:
         """
         Get slow queries from pg_stat_statements (if available).
         Args:
             limit: Maximum number of queries to return
+            min_calls: Skip statements called fewer times than this
         Returns:
             List of slow query information
         """
         try:
-            check_extension = text("""
-                SELECT EXISTS (
-                    SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'
-                )
-            """)
-            result = await self.session.execute(check_extension)
-            has_extension = result.scalar()
-            if not has_extension:
+            cls = type(self)
+            if cls._has_pgss is None:
+                result = await self.session.execute(_PGSS_PROBE_SQL)
+                probe = result.one()
+                if probe.has_exec_time:
+                    cls._pgss_time_columns = ("total_exec_time", "mean_exec_time")
+                cls._has_pgss = bool(probe.installed)
+            if not cls._has_pgss:
                 logger.warning("pg_stat_statements extension not available")
                 return []
-            slow_queries = text("""
-                SELECT
-                    query,
-                    calls,
-                    total_time,
-                    mean_time,
-                    rows,
-                    100.0 * shared_blks_hit / nullif(shared_blks_hit + shared_blks_read, 0) AS hit_percent
-                FROM pg_stat_statements
-                WHERE query NOT LIKE '%pg_stat_statements%'
-                ORDER BY total_time DESC
-                LIMIT :limit
-            """)
-            result = await self.session.execute(slow_queries, {"limit": limit})
-            queries = result.fetchall()
-            return [
-                {
-                    "query": query.query,
-                    "calls": query.calls,
-                    "total_time_ms": float(query.total_time),
-                    "mean_time_ms": float(query.mean_time),
-                    "rows": query.rows,
-                    "cache_hit_percent": float(query.hit_percent)
-                    if query.hit_percent
-                    else 0.0,
-                }
-                for query in queries
-            ]
+            result = await self.session.execute(
+                _slow_queries_sql(*cls._pgss_time_columns),
+                {"limit": limit, "min_calls": min_calls},
+            )
+            return result.scalar() or []
         except Exception as e:
             logger.error("Failed to get slow queries", extra={"error": str(e)})
             return []
 
-    async def optimize_table(self, table_name: str) -> dict[str, Any]:
+    async def tune_autovacuum(self, table_name: str) -> bool:
+        """
+        Apply the autovacuum settings for a high-churn table.
+        Args:
+            table_name: Name of the table to tune
+        Returns:
+            True if the settings were applied
+        """
+        try:
+            quoted_table = self._quoted_table(table_name)
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    text(f"ALTER TABLE {quoted_table} SET ({_AUTOVACUUM_OPTIONS})")
+                )
+            logger.info(
+                "Tuned table autovacuum",
+                extra={"table_name": table_name, "options": _AUTOVACUUM_OPTIONS},
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                "Failed to tune table autovacuum",
+                extra={"table_name": table_name, "error": str(e)},
+            )
+            return False
+
+    async def optimize_table(
+        self, table_name: str, full: bool = False
+    ) -> dict[str, Any]:
         """
-        Optimize a table by running VACUUM and ANALYZE.
+        Refresh a table's planner statistics, vacuuming it only on request.
+        Routine cleanup is left to autovacuum (see ``tune_autovacuum``).
         Args:
             table_name: Name of the table to optimize
+            full: Also run VACUUM, for bloat recovery
         Returns:
             Dictionary containing optimization results
         """
+        operation = "VACUUM ANALYZE" if full else "ANALYZE"
         try:
-            if not table_name.replace("_", "").isalnum():
-                raise ValueError(f"Invalid table name: {table_name}")
-            vacuum_query = text(f"VACUUM ANALYZE {table_name}")
-            await self.session.execute(vacuum_query)
+            quoted_table = self._quoted_table(table_name)
+            if full:
+                # VACUUM cannot run inside a transaction block.
+                async with self.engine.connect() as conn:
+                    conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                    await conn.execute(_table_sql("VACUUM", quoted_table))
+            # analyze_table_statistics runs the ANALYZE itself.
+            stats = await self.analyze_table_statistics(table_name)
             logger.info(
                 "Optimized table",
-                extra={"table_name": table_name, "operation": "VACUUM ANALYZE"},
+                extra={"table_name": table_name, "operation": operation},
             )
-            stats = await self.analyze_table_statistics(table_name)
             return {
                 "success": True,
                 "table_name": table_name,
-                "operation": "VACUUM ANALYZE",
+                "operation": operation,
                 "statistics": stats,
             }
         except Exception as e:
@@ -261,37 +363,23 @@ class IndexManager:
             )
             return {"success": False, "table_name": table_name, "error": str(e)}
 
-    async def get_index_usage_stats(self) -> list[dict[str, Any]]:
+    async def get_index_usage_stats(
+        self, min_size_bytes: int = 1024 * 1024, limit: int = 100
+    ) -> list[dict[str, Any]]:
         """
-        Get index usage statistics.
+        Get usage statistics for removal candidates: non-unique indexes that
+        were never scanned or are larger than ``min_size_bytes``.
+        Args:
+            min_size_bytes: Size above which a scanned index is still reported
+            limit: Maximum number of indexes to return
         Returns:
-            List of index usage statistics
+            List of index usage statistics, least-scanned and largest first
         """
         try:
-            query = text("""
-                SELECT
-                    schemaname,
-                    tablename,
-                    indexname,
-                    idx_tup_read,
-                    idx_tup_fetch,
-                    idx_scan
-                FROM pg_stat_user_indexes
-                ORDER BY idx_scan DESC;
-            """)
-            result = await self.session.execute(query)
-            stats = []
-            for row in result:
-                stats.append(
-                    {
-                        "schema": row.schemaname,
-                        "table": row.tablename,
-                        "index": row.indexname,
-                        "tuples_read": row.idx_tup_read,
-                        "tuples_fetched": row.idx_tup_fetch,
-                        "scans": row.idx_scan,
-                    }
-                )
+            result = await self.session.execute(
+                _INDEX_USAGE_SQL, {"min_size_bytes": min_size_bytes, "limit": limit}
+            )
+            stats = result.scalar() or []
             logger.info(
                 "Retrieved index usage statistics", extra={"index_count": len(stats)}
             )
@@ -303,18 +391,43 @@ class IndexManager:
             return []
 
 
-async def create_optimized_indexes(session: AsyncSession) -> dict[str, bool]:
+async def create_optimized_indexes(
+    session: AsyncSession, engine: AsyncEngine | None = None
+) -> dict[str, bool]:
     """
     Convenience function to create all performance indexes.
     Args:
         session: Database session
+        engine: Engine for the autocommit DDL connection (defaults to the session's)
     Returns:
         Dictionary mapping index name to creation success status
     """
-    index_manager = IndexManager(session)
+    index_manager = IndexManager(session, engine)
     return await index_manager.create_performance_indexes()
 
 
+async def verify_performance_indexes(session: AsyncSession) -> dict[str, bool]:
+    """
+    Check which performance indexes exist without running any DDL.
+    Missing indexes are created out of band with
+    ``python scripts/db_indexes_cli.py bootstrap``.
+    Args:
+        session: Database session
+    Returns:
+        Dictionary mapping index name to whether it exists
+    """
+    names = [index_config["name"] for index_config in PERFORMANCE_INDEXES]
+    result = await session.execute(_EXISTING_INDEXES_SQL, {"names": names})
+    existing = set(result.scalars())
+    status = {name: name in existing for name in names}
+    missing = [name for name, present in status.items() if not present]
+    if missing:
+        logger.warning(
+            "Performance indexes missing", extra={"missing_indexes": missing}
+        )
+    return status
+
+
 async def analyze_database_performance(session: AsyncSession) -> dict[str, Any]:
     """
     Analyze comprehensive database performance metrics.
@@ -325,18 +438,34 @@ async def analyze_database_performance(session: AsyncSession) -> dict[str, Any]:
     """
     try:
         index_manager = IndexManager(session)
-        table_stats = {}
         main_tables = ["jobs", "users", "backtests", "strategies", "alembic_version"]
-        for table_name in main_tables:
+        # Each table gets its own pooled session so the ANALYZE round trips
+        # overlap; the semaphore keeps this from draining the pool.
+        semaphore = asyncio.Semaphore(TABLE_ANALYSIS_CONCURRENCY)
+
+        async def analyze(table_name: str) -> dict[str, Any]:
             try:
-                stats = await index_manager.analyze_table_statistics(table_name)
-                table_stats[table_name] = stats
+                async with (
+                    semaphore,
+                    AsyncSession(index_manager.engine) as table_session,
+                ):
+                    return await IndexManager(
+                        table_session, index_manager.engine
+                    ).analyze_table_statistics(table_name)
             except Exception as e:
                 logger.warning(
                     f"Failed to analyze table {table_name}",
                     extra={"table_name": table_name, "error": str(e)},
                 )
-                table_stats[table_name] = {"error": str(e)}
+                return {"error": str(e)}
+
+        table_stats = dict(
+            zip(
+                main_tables,
+                await asyncio.gather(*(analyze(t) for t in main_tables)),
+                strict=True,
+            )
+        )
         slow_queries = await index_manager.get_slow_queries()
         index_usage = await index_manager.get_index_usage_stats()
         return {
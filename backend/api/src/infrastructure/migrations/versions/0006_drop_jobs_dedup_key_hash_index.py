@@ -0,0 +1,26 @@
+"""Drop the hash index on jobs.dedup_key
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """uq_job_dedup_key already serves equality lookups on dedup_key"""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_dedup_key_hash")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_dedup_key_hash "
+            "ON jobs USING hash (dedup_key) WHERE dedup_key IS NOT NULL"
+        )
@@ -0,0 +1,28 @@
+"""Prepare jobs for the covering queue index
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 12:10:00.000000
+"""
+
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Leave page headroom for HOT updates so status/progress writes keep the
+    visibility map set for index-only scans, and drop the old non-covering
+    idx_jobs_priority_created_at so create_performance_indexes rebuilds it
+    with its INCLUDE columns.
+    """
+    op.execute("ALTER TABLE jobs SET (fillfactor = 85)")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_priority_created_at")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE jobs RESET (fillfactor)")
@@ -0,0 +1,53 @@
+"""Store jobs.priority as SMALLINT
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 12:20:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Map low/normal/high to 1/5/9. Dropping the string column also drops
+    idx_jobs_priority_created_at; create_performance_indexes rebuilds it.
+    """
+    op.add_column(
+        "jobs",
+        sa.Column("priority_i", sa.SmallInteger(), nullable=False, server_default="5"),
+    )
+    op.execute(
+        """
+        UPDATE jobs SET priority_i = CASE priority
+            WHEN 'low' THEN 1
+            WHEN 'high' THEN 9
+            ELSE 5
+        END
+        """
+    )
+    op.drop_column("jobs", "priority")
+    op.alter_column("jobs", "priority_i", new_column_name="priority")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "jobs",
+        sa.Column("priority_s", sa.String(20), nullable=False, server_default="normal"),
+    )
+    op.execute(
+        """
+        UPDATE jobs SET priority_s = CASE
+            WHEN priority <= 1 THEN 'low'
+            WHEN priority >= 9 THEN 'high'
+            ELSE 'normal'
+        END
+        """
+    )
+    op.drop_column("jobs", "priority")
+    op.alter_column("jobs", "priority_s", new_column_name="priority")
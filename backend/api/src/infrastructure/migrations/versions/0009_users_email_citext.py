@@ -0,0 +1,40 @@
+"""Store users.email as CITEXT
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 12:30:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import CITEXT
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """ix_users_email becomes case-insensitive, so the LOWER(email) index goes"""
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.alter_column(
+        "users",
+        "email",
+        type_=CITEXT(),
+        existing_type=sa.String(length=255),
+        existing_nullable=False,
+        postgresql_using="email::citext",
+    )
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_email_lower")
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "users",
+        "email",
+        type_=sa.String(length=255),
+        existing_type=CITEXT(),
+        existing_nullable=False,
+        postgresql_using="email::varchar(255)",
+    )
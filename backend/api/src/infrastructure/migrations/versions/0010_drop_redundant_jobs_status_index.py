@@ -0,0 +1,32 @@
+"""Drop ix_jobs_status in favour of idx_jobs_status_created_at
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 12:40:00.000000
+"""
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    The (status, created_at DESC) composite serves every status equality
+    lookup, so make sure it exists before dropping the single-column index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_status_created_at "
+            "ON jobs (status, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_status ON jobs (status)"
+        )
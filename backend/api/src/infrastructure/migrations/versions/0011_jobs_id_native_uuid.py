@@ -0,0 +1,35 @@
+"""Store jobs.id as native UUID
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 13:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "jobs",
+        "id",
+        type_=sa.Uuid(),
+        existing_type=sa.String(36),
+        existing_nullable=False,
+        postgresql_using="id::uuid",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "jobs",
+        "id",
+        type_=sa.String(36),
+        existing_type=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using="id::text",
+    )
@@ -0,0 +1,28 @@
+"""Move the job queue index into the migration chain
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 13:10:00.000000
+"""
+
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """ix_jobs_pending_queue replaces the runtime-created idx_jobs_priority_created_at"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_pending_queue "
+            "ON jobs (priority DESC, created_at) INCLUDE (id, worker_id, attempts) "
+            "WHERE status IN ('pending', 'retry')"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_priority_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_pending_queue")
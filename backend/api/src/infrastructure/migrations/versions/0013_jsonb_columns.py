@@ -0,0 +1,67 @@
+"""Store JSON columns as JSONB
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 13:30:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = (
+    ("jobs", "payload", False),
+    ("backtest_history", "strategy_params", False),
+    ("backtest_history", "datasets_used", True),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in _JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    # strategies.params was never added by a migration; schemas built from the
+    # models directly have it as varchar(1000).
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("strategies")}
+    if "params" in columns:
+        op.alter_column(
+            "strategies",
+            "params",
+            type_=JSONB(),
+            existing_type=sa.String(length=1000),
+            existing_nullable=True,
+            postgresql_using="params::jsonb",
+        )
+    else:
+        op.add_column("strategies", sa.Column("params", JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "strategies",
+        "params",
+        type_=sa.String(length=1000),
+        existing_type=JSONB(),
+        existing_nullable=True,
+        postgresql_using="params::text",
+    )
+    for table, column, nullable in _JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,31 @@
+"""Index backtest_history on (user_id, created_at DESC)
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17 13:50:00.000000
+"""
+
+from alembic import op
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """The composite index replaces the standalone user_id index"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bh_user_created "
+            "ON backtest_history (user_id, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backtest_history_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backtest_history_user_id "
+            "ON backtest_history (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bh_user_created")
@@ -0,0 +1,37 @@
+"""Store backtest_history start/end dates as DATE
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 14:20:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for column in ("start_date", "end_date"):
+        op.alter_column(
+            "backtest_history",
+            column,
+            type_=sa.Date(),
+            existing_type=sa.String(length=50),
+            existing_nullable=True,
+            postgresql_using=f"to_date(NULLIF({column}, ''), 'YYYY-MM-DD')",
+        )
+
+
+def downgrade() -> None:
+    for column in ("start_date", "end_date"):
+        op.alter_column(
+            "backtest_history",
+            column,
+            type_=sa.String(length=50),
+            existing_type=sa.Date(),
+            existing_nullable=True,
+            postgresql_using=f"to_char({column}, 'YYYY-MM-DD')",
+        )
@@ -0,0 +1,38 @@
+"""Constrain jobs.status and jobs.priority to their known values
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17 14:40:00.000000
+"""
+
+from alembic import op
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+_CHECKS = {
+    "ck_jobs_status": (
+        "status IN ('pending', 'processing', 'retry', 'completed', 'failed', "
+        "'cancelled')"
+    ),
+    "ck_jobs_priority": "priority BETWEEN 1 AND 9",
+}
+
+
+def upgrade() -> None:
+    """Add NOT VALID first so the full-table check runs without blocking writes"""
+    for name, condition in _CHECKS.items():
+        op.execute(
+            f"ALTER TABLE jobs ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID"
+        )
+    # Outside the migration transaction, so the ACCESS EXCLUSIVE lock taken by
+    # ADD CONSTRAINT is released before the scan.
+    with op.get_context().autocommit_block():
+        for name in _CHECKS:
+            op.execute(f"ALTER TABLE jobs VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name in _CHECKS:
+        op.drop_constraint(name, "jobs", type_="check")
@@ -0,0 +1,28 @@
+"""Covering (status, updated_at) index for job monitoring and cleanup
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-17 15:10:00.000000
+"""
+
+from alembic import op
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """ix_jobs_status_updated replaces two runtime-created partial indexes"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_status_updated "
+            "ON jobs (status, updated_at) INCLUDE (id, worker_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_updated_at_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_progress_processing")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_status_updated")
@@ -0,0 +1,51 @@
+"""Store event timestamps as TIMESTAMPTZ with server-side defaults
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-17 15:40:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable, has server default)
+_COLUMNS = (
+    ("users", "created_at", False, True),
+    ("backtests", "created_at", False, True),
+    ("jobs", "created_at", False, True),
+    ("jobs", "updated_at", False, True),
+    ("jobs", "started_at", True, False),
+    ("jobs", "completed_at", True, False),
+    ("backtest_history", "created_at", False, True),
+    ("backtest_history", "completed_at", True, False),
+)
+
+
+def upgrade() -> None:
+    """Existing naive values were written as UTC"""
+    for table, column, nullable, has_default in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            server_default=sa.func.now() if has_default else None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable, _has_default in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
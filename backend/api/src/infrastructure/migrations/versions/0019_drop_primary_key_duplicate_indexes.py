@@ -0,0 +1,28 @@
+"""Drop indexes that duplicate primary keys
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-17 16:10:00.000000
+"""
+
+from alembic import op
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """The primary key index already serves every lookup by id"""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backtest_history_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backtest_history_id "
+            "ON backtest_history (id)"
+        )
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_id ON users (id)")
@@ -1,27 +1,33 @@
-import uuid
-from datetime import datetime
+from datetime import date, datetime
+from enum import IntEnum
 
 from sqlalchemy import (
-    JSON,
+    CheckConstraint,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
+    Uuid,
+    func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from infrastructure.db import Base
+from utils.ids import uuid7
 
 
 class User(Base):
     __tablename__ = "users"
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    email: Mapped[str] = mapped_column(
-        String(255), unique=True, index=True, nullable=False
-    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    email: Mapped[str] = mapped_column(CITEXT, unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=True)
     cognito_sub: Mapped[str] = mapped_column(
         String(255), unique=True, index=True, nullable=True
@@ -31,11 +37,15 @@ class User(Base):
         String(50), nullable=False, default="email"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # Collections never load implicitly: a lazy load per parent is an N+1, and
+    # under AsyncSession it cannot run anyway. Use selectinload() in the query.
+    strategies: Mapped[list["Strategy"]] = relationship(
+        back_populates="owner", lazy="raise_on_sql"
     )
-    strategies: Mapped[list["Strategy"]] = relationship(back_populates="owner")
     backtest_histories: Mapped[list["BacktestHistory"]] = relationship(
-        back_populates="user"
+        back_populates="user", lazy="raise_on_sql"
     )
 
 
@@ -45,9 +55,11 @@ class Strategy(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     type: Mapped[str] = mapped_column(String(50), nullable=False)
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    params: Mapped[str] = mapped_column(String(1000), nullable=True)
+    params: Mapped[dict] = mapped_column(JSONB, nullable=True)
     owner: Mapped[User] = relationship(back_populates="strategies")
-    backtests: Mapped[list["Backtest"]] = relationship(back_populates="strategy")
+    backtests: Mapped[list["Backtest"]] = relationship(
+        back_populates="strategy", lazy="raise_on_sql"
+    )
 
 
 class Backtest(Base):
@@ -62,48 +74,91 @@ class Backtest(Base):
     pnl: Mapped[float] = mapped_column(Float, nullable=True)
     max_drawdown: Mapped[float] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     strategy: Mapped[Strategy] = relationship(back_populates="backtests")
 
 
+class JobPriority(IntEnum):
+    """Queue priority stored as SMALLINT; higher values are more urgent."""
+
+    LOW = 1
+    NORMAL = 5
+    HIGH = 9
+
+
+JOB_STATUSES = ("pending", "processing", "retry", "completed", "failed", "cancelled")
+
+
 class Job(Base):
     __tablename__ = "jobs"
-    __table_args__ = (UniqueConstraint("dedup_key", name="uq_job_dedup_key"),)
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        UniqueConstraint("dedup_key", name="uq_job_dedup_key"),
+        CheckConstraint(
+            "status IN (" + ", ".join(f"'{s}'" for s in JOB_STATUSES) + ")",
+            name="ck_jobs_status",
+        ),
+        CheckConstraint(
+            f"priority BETWEEN {JobPriority.LOW:d} AND {JobPriority.HIGH:d}",
+            name="ck_jobs_priority",
+        ),
     )
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="pending", index=True
+    id: Mapped[str] = mapped_column(
+        Uuid(as_uuid=False), primary_key=True, default=uuid7
     )
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    priority: Mapped[str] = mapped_column(String(20), nullable=False, default="normal")
+    priority: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=JobPriority.NORMAL
+    )
     worker_id: Mapped[str] = mapped_column(String(100), nullable=True)
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     error: Mapped[str] = mapped_column(Text, nullable=True)
     artifact_url: Mapped[str] = mapped_column(String(500), nullable=True)
-    dedup_key: Mapped[str] = mapped_column(String(255), nullable=True, unique=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    dedup_key: Mapped[str] = mapped_column(String(255), nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
+# Queue polling: next pollable job by priority, oldest first, as an index-only scan.
+Index(
+    "ix_jobs_pending_queue",
+    Job.priority.desc(),
+    Job.created_at,
+    postgresql_include=["id", "worker_id", "attempts"],
+    postgresql_where=text("status IN ('pending', 'retry')"),
+)
+
+# Status counts, stuck-job scans and cleanup filter on status with an
+# updated_at range and only need id/worker_id back: index-only scans.
+Index(
+    "ix_jobs_status_updated",
+    Job.status,
+    Job.updated_at,
+    postgresql_include=["id", "worker_id"],
+)
+
+
 class BacktestHistory(Base):
     __tablename__ = "backtest_history"
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id"), nullable=False, index=True
-    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     strategy: Mapped[str] = mapped_column(String(100), nullable=False)
-    strategy_params: Mapped[dict] = mapped_column(JSON, nullable=False)
-    start_date: Mapped[str] = mapped_column(String(50), nullable=True)
-    end_date: Mapped[str] = mapped_column(String(50), nullable=True)
+    strategy_params: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=True)
+    end_date: Mapped[date] = mapped_column(Date, nullable=True)
     initial_capital: Mapped[float] = mapped_column(
         Float, nullable=False, default=10000.0
     )
@@ -111,7 +166,7 @@ class BacktestHistory(Base):
     monte_carlo_method: Mapped[str] = mapped_column(String(50), nullable=True)
     sample_fraction: Mapped[float] = mapped_column(Float, nullable=True)
     gaussian_scale: Mapped[float] = mapped_column(Float, nullable=True)
-    datasets_used: Mapped[dict] = mapped_column(JSON, nullable=True)
+    datasets_used: Mapped[dict] = mapped_column(JSONB, nullable=True)
     price_type: Mapped[str] = mapped_column(String(20), nullable=False, default="close")
     total_return: Mapped[float] = mapped_column(Float, nullable=True)
     sharpe_ratio: Mapped[float] = mapped_column(Float, nullable=True)
@@ -121,7 +176,18 @@ class BacktestHistory(Base):
     execution_time_seconds: Mapped[float] = mapped_column(Float, nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="completed")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
     )
-    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     user: Mapped["User"] = relationship(back_populates="backtest_histories")
+
+
+# "Most recent backtests for a user" is a range scan with no sort step; the
+# leading user_id also serves the foreign key lookups.
+Index(
+    "ix_bh_user_created",
+    BacktestHistory.user_id,
+    BacktestHistory.created_at.desc(),
+)
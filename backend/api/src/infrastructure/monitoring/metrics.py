@@ -5,19 +5,59 @@ health checks, and performance tracking for the Monte Carlo job processing syste
 """
 
 import asyncio
+import functools
 import logging
+import sys
 import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
+TagSet = frozenset[tuple[str, str]]
+_EMPTY_TAGS: TagSet = frozenset()
+
+
+@functools.lru_cache(maxsize=4096)
+def intern_tags(items: tuple[tuple[str, str], ...]) -> TagSet:
+    """Return a shared frozenset of interned ``(key, value)`` tag pairs"""
+    return frozenset((sys.intern(k), sys.intern(v)) for k, v in items)
+
+
+def freeze_tags(tags: dict[str, str] | None) -> TagSet:
+    """Convert a tags dict into its interned frozenset form"""
+    if not tags:
+        return _EMPTY_TAGS
+    return intern_tags(tuple(sorted(tags.items())))
+
+
+@functools.lru_cache(maxsize=4096)
+def _tagged_key(name: str, tags: frozenset[tuple[str, str]]) -> str:
+    tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags))
+    return f"{name}[{tag_str}]"
+
+
+def series_key(name: str, tags: dict[str, str] | None) -> str:
+    """Return the ``name[k=v,...]`` storage key, memoized per name and tag set"""
+    if not tags:
+        return name
+    return _tagged_key(name, frozenset(tags.items()))
+
 
 class MonitoringInterface(ABC):
     """Interface for monitoring services"""
@@ -44,63 +84,182 @@ class MonitoringInterface(ABC):
         pass
 
 
-@dataclass
+def ttl_cached[T](seconds: float) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Cache a zero-argument function's result for ``seconds``"""
+    ttl_ns = int(seconds * 1e9)
+
+    def decorator(func: Callable[[], T]) -> Callable[[], T]:
+        cached: tuple[int, T] | None = None
+
+        @functools.wraps(func)
+        def wrapper() -> T:
+            nonlocal cached
+            now = time.monotonic_ns()
+            if cached is None or now >= cached[0]:
+                cached = (now + ttl_ns, func())
+            return cached[1]
+
+        return wrapper
+
+    return decorator
+
+
+def _to_iso(timestamp_ns: int) -> str:
+    """Render a ``time.time_ns()`` value as an ISO-8601 UTC timestamp"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, UTC).isoformat()
+
+
+@dataclass(slots=True)
 class MetricPoint:
-    """Individual metric data point"""
+    """Individual metric data point; ``timestamp_ns`` is Unix time in nanoseconds"""
 
     name: str
     value: float
-    timestamp: datetime
-    tags: dict[str, str] = field(default_factory=dict)
+    timestamp_ns: int
+    tags: TagSet = _EMPTY_TAGS
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
-    """Health check result"""
+    """Health check result; ``timestamp_ns`` is Unix time in nanoseconds"""
 
     name: str
     status: str
     message: str
-    timestamp: datetime
+    timestamp_ns: int
     details: dict[str, Any] = field(default_factory=dict)
 
 
+class _MetricShard:
+    """One lock plus the metric series and counters whose keys hash to it"""
+
+    __slots__ = ("lock", "metrics", "counters")
+
+    def __init__(self, max_points_per_metric: int):
+        self.lock = threading.Lock()
+        self.metrics: dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=max_points_per_metric)
+        )
+        self.counters: dict[str, float] = defaultdict(float)
+
+
+_Pending = deque[tuple[str, MetricPoint]]
+
+
+class _ThreadBuffer:
+    """Points one thread has recorded but not yet published to the shards"""
+
+    __slots__ = ("points", "lock", "__weakref__")
+
+    def __init__(self) -> None:
+        # The owner appends without locking (deque.append is thread-safe);
+        # the lock only serializes drains so batches publish in order.
+        self.points: _Pending = deque()
+        self.lock = threading.Lock()
+
+
 class MetricsCollector:
     """Collects and stores metrics in memory"""
 
+    # Power of two so the shard index is a mask of the key hash.
+    SHARD_COUNT = 64
+    # Points a thread buffers locally before publishing them to the shards.
+    FLUSH_THRESHOLD = 128
+
     def __init__(self, max_points_per_metric: int = 1000):
         """
         Initialize metrics collector.
+        Metrics are spread over SHARD_COUNT independently locked shards, so
+        producers recording different metrics do not contend on one lock.
+        record_metric appends to a per-thread buffer and only touches the
+        shard locks once per FLUSH_THRESHOLD points; readers drain every
+        buffer first, so pending points are never hidden from them.
         Args:
             max_points_per_metric: Maximum number of points to keep per metric
         """
         self.max_points_per_metric = max_points_per_metric
-        self._metrics: dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=max_points_per_metric)
+        self._shards = tuple(
+            _MetricShard(max_points_per_metric) for _ in range(self.SHARD_COUNT)
         )
-        self._counters: dict[str, float] = defaultdict(float)
-        self._lock = threading.RLock()
+        self._tls = threading.local()
+        self._buffers: weakref.WeakSet[_ThreadBuffer] = weakref.WeakSet()
+        self._buffers_lock = threading.Lock()
         logger.info("Initialized metrics collector")
 
+    def _shard(self, metric_key: str) -> _MetricShard:
+        return self._shards[hash(metric_key) & (self.SHARD_COUNT - 1)]
+
+    def _local_buffer(self) -> _ThreadBuffer:
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.add(buf)
+            # The buffer dies with its thread's locals; publish what it held.
+            weakref.finalize(buf, self._publish, buf.points)
+        return buf
+
+    def _drain(self, buf: _ThreadBuffer) -> None:
+        """Publish a live thread's buffer; concurrent drains take turns"""
+        with buf.lock:
+            self._publish(buf.points)
+
+    def _publish(self, points: _Pending) -> None:
+        """Move pending points into their shards, one lock hold per shard"""
+        by_shard: dict[int, list[tuple[str, MetricPoint]]] = defaultdict(list)
+        mask = self.SHARD_COUNT - 1
+        try:
+            while True:
+                item = points.popleft()
+                by_shard[hash(item[0]) & mask].append(item)
+        except IndexError:
+            pass
+        for index, items in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                for metric_key, point in items:
+                    shard.metrics[metric_key].append(point)
+
+    def flush(self) -> None:
+        """Publish points still sitting in any thread's local buffer"""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        for buf in buffers:
+            if buf.points:
+                self._drain(buf)
+
     def record_metric(
         self, name: str, value: float, tags: dict[str, str] | None = None
     ) -> None:
         """Record a metric value"""
-        with self._lock:
-            metric_key = self._create_metric_key(name, tags or {})
-            point = MetricPoint(
-                name=name, value=value, timestamp=datetime.now(UTC), tags=tags or {}
-            )
-            self._metrics[metric_key].append(point)
+        metric_key, frozen_tags = self._resolve_key(name, tags)
+        point = MetricPoint(
+            name=name,
+            value=value,
+            timestamp_ns=time.time_ns(),
+            tags=frozen_tags,
+        )
+        buf = self._local_buffer()
+        buf.points.append((metric_key, point))
+        if len(buf.points) >= self.FLUSH_THRESHOLD:
+            self._drain(buf)
 
     def increment_counter(
         self, name: str, tags: dict[str, str] | None = None, value: float = 1.0
     ) -> None:
         """Increment a counter metric"""
-        with self._lock:
-            counter_key = self._create_metric_key(name, tags or {})
-            self._counters[counter_key] += value
-            self.record_metric(name, self._counters[counter_key], tags)
+        counter_key, frozen_tags = self._resolve_key(name, tags)
+        shard = self._shard(counter_key)
+        with shard.lock:
+            shard.counters[counter_key] += value
+            shard.metrics[counter_key].append(
+                MetricPoint(
+                    name=name,
+                    value=shard.counters[counter_key],
+                    timestamp_ns=time.time_ns(),
+                    tags=frozen_tags,
+                )
+            )
 
     def record_timing(
         self, name: str, duration_ms: float, tags: dict[str, str] | None = None
@@ -112,54 +271,94 @@ class MetricsCollector:
         self, name: str, tags: dict[str, str] | None = None
     ) -> list[MetricPoint]:
         """Get metric points for a specific metric"""
-        with self._lock:
-            metric_key = self._create_metric_key(name, tags or {})
-            return list(self._metrics.get(metric_key, []))
+        self.flush()
+        metric_key = self._create_metric_key(name, tags or {})
+        shard = self._shard(metric_key)
+        with shard.lock:
+            return list(shard.metrics.get(metric_key, []))
 
     def get_counter_value(self, name: str, tags: dict[str, str] | None = None) -> float:
         """Get current counter value"""
-        with self._lock:
-            counter_key = self._create_metric_key(name, tags or {})
-            return self._counters.get(counter_key, 0.0)
+        counter_key = self._create_metric_key(name, tags or {})
+        # A single dict lookup is atomic; writers replace the float, never mutate it.
+        return self._shard(counter_key).counters.get(counter_key, 0.0)
 
     def get_all_metrics(self) -> dict[str, list[MetricPoint]]:
         """Get all collected metrics"""
-        with self._lock:
-            return {key: list(points) for key, points in self._metrics.items()}
+        self.flush()
+        all_metrics: dict[str, list[MetricPoint]] = {}
+        for shard in self._shards:
+            # Hold the shard lock only for the shallow item list, then for
+            # one series copy at a time, so producers never wait on a full
+            # shard's worth of copying.
+            with shard.lock:
+                series = list(shard.metrics.items())
+            for key, points in series:
+                with shard.lock:
+                    all_metrics[key] = list(points)
+        return all_metrics
 
     def clear_metrics(self) -> None:
         """Clear all collected metrics"""
-        with self._lock:
-            self._metrics.clear()
-            self._counters.clear()
+        self.flush()
+        for shard in self._shards:
+            with shard.lock:
+                shard.metrics.clear()
+                shard.counters.clear()
 
     def _create_metric_key(self, name: str, tags: dict[str, str]) -> str:
         """Create a unique key for a metric with tags"""
-        if not tags:
-            return name
-        tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{name}[{tag_str}]"
+        return series_key(name, tags)
+
+    @staticmethod
+    def _resolve_key(name: str, tags: dict[str, str] | None) -> tuple[str, TagSet]:
+        """Return the storage key and interned tags from one tag normalization.
+
+        Both come back as the same cached objects for a given series, so
+        their hashes are computed once and every later dict lookup reuses
+        them.
+        """
+        frozen_tags = freeze_tags(tags)
+        if not frozen_tags:
+            return name, frozen_tags
+        return _tagged_key(name, frozen_tags), frozen_tags
 
 
 class HealthChecker:
     """Performs health checks on system components"""
 
-    def __init__(self):
-        """Initialize health checker"""
+    def __init__(self, check_timeout: float = 5.0, max_age_ms: float = 500.0):
+        """
+        Initialize health checker.
+        Args:
+            check_timeout: Seconds a single check may run before it is reported unhealthy
+            max_age_ms: How long a check result is served from cache before rerunning
+        """
+        self.check_timeout = check_timeout
+        self.cache_ttl_ns = int(max_age_ms * 1_000_000)
         self._health_checks: dict[str, Callable] = {}
+        self._check_ttl_ns: dict[str, int] = {}
+        # Copy-on-write: writers publish a new dict, readers never lock.
         self._last_results: dict[str, HealthCheck] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         logger.info("Initialized health checker")
 
-    def register_health_check(self, name: str, check_func: Callable) -> None:
+    def register_health_check(
+        self, name: str, check_func: Callable, ttl_ms: float | None = None
+    ) -> None:
         """
         Register a health check function.
         Args:
             name: Name of the health check
             check_func: Function that returns (status, message, details)
+            ttl_ms: Per-check override of the result cache window (0 disables it)
         """
         with self._lock:
             self._health_checks[name] = check_func
+            if ttl_ms is None:
+                self._check_ttl_ns.pop(name, None)
+            else:
+                self._check_ttl_ns[name] = int(ttl_ms * 1_000_000)
             logger.info(f"Registered health check: {name}")
 
     async def run_health_check(self, name: str) -> HealthCheck:
@@ -169,14 +368,24 @@ class HealthChecker:
                 name=name,
                 status="unhealthy",
                 message=f"Health check '{name}' not found",
-                timestamp=datetime.now(UTC),
+                timestamp_ns=time.time_ns(),
             )
+        previous = self._last_results.get(name)
+        if previous is not None:
+            ttl_ns = self._check_ttl_ns.get(name, self.cache_ttl_ns)
+            if time.time_ns() - previous.timestamp_ns < ttl_ns:
+                return previous
         try:
             check_func = self._health_checks[name]
+            # Sync checks (psutil) run in a worker thread so they never block the loop.
             if asyncio.iscoroutinefunction(check_func):
-                result = await check_func()
+                pending = check_func()
             else:
-                result = check_func()
+                pending = asyncio.to_thread(check_func)
+            try:
+                result = await asyncio.wait_for(pending, timeout=self.check_timeout)
+            except TimeoutError as e:
+                raise TimeoutError(f"timed out after {self.check_timeout:g}s") from e
             if isinstance(result, tuple):
                 if len(result) == 2:
                     status, message = result
@@ -195,41 +404,63 @@ class HealthChecker:
                 name=name,
                 status=status,
                 message=message,
-                timestamp=datetime.now(UTC),
+                timestamp_ns=time.time_ns(),
                 details=details,
             )
-            with self._lock:
-                self._last_results[name] = health_check
+            self._store_result(health_check)
             return health_check
         except Exception as e:
             error_check = HealthCheck(
                 name=name,
                 status="unhealthy",
                 message=f"Health check failed: {str(e)}",
-                timestamp=datetime.now(UTC),
+                timestamp_ns=time.time_ns(),
                 details={"error": str(e)},
             )
-            with self._lock:
-                self._last_results[name] = error_check
+            self._store_result(error_check)
             logger.error(f"Health check '{name}' failed: {str(e)}")
             return error_check
 
     async def run_all_health_checks(self) -> dict[str, HealthCheck]:
-        """Run all registered health checks"""
-        results = {}
-        for name in self._health_checks:
-            results[name] = await self.run_health_check(name)
-        return results
+        """Run all registered health checks concurrently"""
+        with self._lock:
+            names = list(self._health_checks)
+        results = await asyncio.gather(*(self.run_health_check(n) for n in names))
+        return dict(zip(names, results, strict=True))
+
+    def _store_result(self, check: HealthCheck) -> None:
+        with self._lock:
+            self._last_results = {**self._last_results, check.name: check}
 
     def get_last_result(self, name: str) -> HealthCheck | None:
         """Get the last result for a health check"""
-        with self._lock:
-            return self._last_results.get(name)
+        return self._last_results.get(name)
 
-    def get_all_last_results(self) -> dict[str, HealthCheck]:
-        """Get all last health check results"""
-        with self._lock:
-            return self._last_results.copy()
+    def get_all_last_results(self) -> Mapping[str, HealthCheck]:
+        """Get a read-only snapshot of all last health check results"""
+        return MappingProxyType(self._last_results)
+
+
+class _TimingRing:
+    """Fixed-size float64 ring buffer holding the latest timings of one operation"""
+
+    __slots__ = ("buffer", "head", "count")
+
+    def __init__(self, size: int):
+        self.buffer = np.empty(size, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        size = self.buffer.shape[0]
+        self.buffer[self.head] = value
+        self.head = (self.head + 1) % size
+        if self.count < size:
+            self.count += 1
+
+    def values(self) -> np.ndarray:
+        """Copy of the valid samples (unordered, which statistics do not need)"""
+        return self.buffer[: self.count].copy()
 
 
 class PerformanceTracker:
@@ -242,8 +473,10 @@ class PerformanceTracker:
             window_size: Size of the sliding window for calculations
         """
         self.window_size = window_size
-        self._timings: dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
-        self._lock = threading.RLock()
+        self._timings: dict[str, _TimingRing] = defaultdict(
+            lambda: _TimingRing(window_size)
+        )
+        self._lock = threading.Lock()
         logger.info("Initialized performance tracker")
 
     @asynccontextmanager
@@ -251,11 +484,11 @@ class PerformanceTracker:
         self, operation_name: str, tags: dict[str, str] | None = None
     ):
         """Context manager for tracking operation timing"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             self.record_timing(operation_name, duration_ms, tags)
 
     def record_timing(
@@ -265,45 +498,47 @@ class PerformanceTracker:
         tags: dict[str, str] | None = None,
     ) -> None:
         """Record timing for an operation"""
+        key = self._create_key(operation_name, tags or {})
         with self._lock:
-            key = self._create_key(operation_name, tags or {})
             self._timings[key].append(duration_ms)
 
     def get_statistics(
         self, operation_name: str, tags: dict[str, str] | None = None
     ) -> dict[str, float]:
         """Get statistics for an operation"""
+        key = self._create_key(operation_name, tags or {})
         with self._lock:
-            key = self._create_key(operation_name, tags or {})
-            timings = list(self._timings.get(key, []))
-            if not timings:
-                return {
-                    "count": 0,
-                    "avg_ms": 0.0,
-                    "min_ms": 0.0,
-                    "max_ms": 0.0,
-                    "p50_ms": 0.0,
-                    "p95_ms": 0.0,
-                    "p99_ms": 0.0,
-                }
-            timings.sort()
-            count = len(timings)
+            ring = self._timings.get(key)
+            timings = ring.values() if ring is not None else None
+        if timings is None or timings.size == 0:
             return {
-                "count": count,
-                "avg_ms": sum(timings) / count,
-                "min_ms": timings[0],
-                "max_ms": timings[-1],
-                "p50_ms": timings[int(count * 0.5)],
-                "p95_ms": timings[int(count * 0.95)],
-                "p99_ms": timings[int(count * 0.99)],
+                "count": 0,
+                "avg_ms": 0.0,
+                "min_ms": 0.0,
+                "max_ms": 0.0,
+                "p50_ms": 0.0,
+                "p95_ms": 0.0,
+                "p99_ms": 0.0,
             }
+        count = int(timings.size)
+        # Nearest-rank indices into the sorted window; partition places just
+        # those ranks instead of sorting everything.
+        ranks = [int(count * 0.5), int(count * 0.95), int(count * 0.99)]
+        timings.partition(ranks)
+        p50, p95, p99 = timings[ranks].tolist()
+        return {
+            "count": count,
+            "avg_ms": float(timings.mean()),
+            "min_ms": float(timings.min()),
+            "max_ms": float(timings.max()),
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+        }
 
     def _create_key(self, operation_name: str, tags: dict[str, str]) -> str:
         """Create a unique key for an operation with tags"""
-        if not tags:
-            return operation_name
-        tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{operation_name}[{tag_str}]"
+        return series_key(operation_name, tags)
 
 
 class MonitoringService(MonitoringInterface):
@@ -357,7 +592,7 @@ class MonitoringService(MonitoringInterface):
                 name: {
                     "status": check.status,
                     "message": check.message,
-                    "timestamp": check.timestamp.isoformat(),
+                    "timestamp": _to_iso(check.timestamp_ns),
                     "details": check.details,
                 }
                 for name, check in health_results.items()
@@ -380,14 +615,17 @@ class MonitoringService(MonitoringInterface):
         }
         for metric_key, points in all_metrics.items():
             if points:
-                values = [p.value for p in points]
+                # One float64 buffer instead of a list of boxed floats.
+                values = np.fromiter(
+                    (p.value for p in points), dtype=np.float64, count=len(points)
+                )
                 summary["metrics"][metric_key] = {
-                    "count": len(values),
-                    "latest_value": values[-1],
-                    "avg_value": sum(values) / len(values),
-                    "min_value": min(values),
-                    "max_value": max(values),
-                    "latest_timestamp": points[-1].timestamp.isoformat(),
+                    "count": len(points),
+                    "latest_value": points[-1].value,
+                    "avg_value": float(values.mean()),
+                    "min_value": float(values.min()),
+                    "max_value": float(values.max()),
+                    "latest_timestamp": _to_iso(points[-1].timestamp_ns),
                 }
         return summary
 
@@ -395,9 +633,11 @@ class MonitoringService(MonitoringInterface):
         """Get performance statistics summary"""
         return {"timestamp": datetime.now(UTC).isoformat(), "operations": {}}
 
-    def register_health_check(self, name: str, check_func: Callable) -> None:
+    def register_health_check(
+        self, name: str, check_func: Callable, ttl_ms: float | None = None
+    ) -> None:
         """Register a custom health check"""
-        self.health_checker.register_health_check(name, check_func)
+        self.health_checker.register_health_check(name, check_func, ttl_ms)
 
     @asynccontextmanager
     async def track_operation(
@@ -410,11 +650,12 @@ class MonitoringService(MonitoringInterface):
     def _register_default_health_checks(self) -> None:
         """Register default system health checks"""
 
+        @ttl_cached(seconds=1.0)
         def memory_check():
             """Check memory usage"""
+            if psutil is None:
+                return "warning", "psutil not available for memory monitoring", {}
             try:
-                import psutil
-
                 memory = psutil.virtual_memory()
                 if memory.percent > 90:
                     return (
@@ -434,16 +675,15 @@ class MonitoringService(MonitoringInterface):
                         f"Memory usage: {memory.percent:.1f}%",
                         {"memory_percent": memory.percent},
                     )
-            except ImportError:
-                return "warning", "psutil not available for memory monitoring", {}
             except Exception as e:
                 return "unhealthy", f"Memory check failed: {str(e)}", {"error": str(e)}
 
+        @ttl_cached(seconds=1.0)
         def disk_check():
             """Check disk usage"""
+            if psutil is None:
+                return "warning", "psutil not available for disk monitoring", {}
             try:
-                import psutil
-
                 disk = psutil.disk_usage("/")
                 percent = (disk.used / disk.total) * 100
                 if percent > 90:
@@ -464,8 +704,6 @@ class MonitoringService(MonitoringInterface):
                         f"Disk usage: {percent:.1f}%",
                         {"disk_percent": percent},
                     )
-            except ImportError:
-                return "warning", "psutil not available for disk monitoring", {}
             except Exception as e:
                 return "unhealthy", f"Disk check failed: {str(e)}", {"error": str(e)}
 
@@ -2,15 +2,22 @@
 Repository for backtest history management.
 """
 
-from datetime import datetime
+from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.models import BacktestHistory
 
 
+def _as_date(value: str | date | None) -> date | None:
+    """Accept the YYYY-MM-DD strings the routes pass around."""
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
 class BacktestHistoryRepository:
     """Repository for backtest history operations."""
 
@@ -22,8 +29,8 @@ class BacktestHistoryRepository:
         user_id: int,
         strategy: str,
         strategy_params: dict[str, Any],
-        start_date: str | None = None,
-        end_date: str | None = None,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
         initial_capital: float = 10000.0,
         monte_carlo_runs: int = 1,
         monte_carlo_method: str | None = None,
@@ -32,25 +39,32 @@ class BacktestHistoryRepository:
         datasets_used: list[str] | None = None,
         price_type: str = "close",
     ) -> BacktestHistory:
-        """Create a new backtest history entry."""
-        history = BacktestHistory(
-            user_id=user_id,
-            strategy=strategy,
-            strategy_params=strategy_params,
-            start_date=start_date,
-            end_date=end_date,
-            initial_capital=initial_capital,
-            monte_carlo_runs=monte_carlo_runs,
-            monte_carlo_method=monte_carlo_method,
-            sample_fraction=sample_fraction,
-            gaussian_scale=gaussian_scale,
-            datasets_used=datasets_used or [],
-            price_type=price_type,
-            status="running",
+        """Create a new backtest history entry.
+
+        A single INSERT ... RETURNING hands back the row with its generated id
+        and server defaults, instead of add() + flush + a refresh SELECT.
+        """
+        stmt = (
+            insert(BacktestHistory)
+            .values(
+                user_id=user_id,
+                strategy=strategy,
+                strategy_params=strategy_params,
+                start_date=_as_date(start_date),
+                end_date=_as_date(end_date),
+                initial_capital=initial_capital,
+                monte_carlo_runs=monte_carlo_runs,
+                monte_carlo_method=monte_carlo_method,
+                sample_fraction=sample_fraction,
+                gaussian_scale=gaussian_scale,
+                datasets_used=datasets_used or [],
+                price_type=price_type,
+                status="running",
+            )
+            .returning(BacktestHistory)
         )
-        self.session.add(history)
+        history = (await self.session.execute(stmt)).scalar_one()
         await self.session.commit()
-        await self.session.refresh(history)
         return history
 
     async def update_results(
@@ -88,7 +102,7 @@ class BacktestHistoryRepository:
         if error_message:
             history.error_message = error_message  # pyright: ignore[reportAttributeAccessIssue]
         if status == "completed":
-            history.completed_at = datetime.utcnow()
+            history.completed_at = datetime.now(UTC)
         await self.session.commit()
         await self.session.refresh(history)
         return history
@@ -110,6 +124,30 @@ class BacktestHistoryRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_user_history_page(
+        self,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0,
+        strategy_filter: str | None = None,
+    ) -> tuple[list[BacktestHistory], int]:
+        """Get one page of user history and the total match count in one query."""
+        query = select(BacktestHistory, func.count().over().label("total_count")).where(
+            BacktestHistory.user_id == user_id
+        )
+        if strategy_filter:
+            query = query.where(BacktestHistory.strategy == strategy_filter)
+        query = (
+            query.order_by(desc(BacktestHistory.created_at)).limit(limit).offset(offset)
+        )
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], int(rows[0][1])
+        if offset == 0:
+            return [], 0
+        # Past the last page the window count has no row to ride on.
+        return [], await self.count_user_history(user_id, strategy_filter)
+
     async def count_user_history(
         self,
         user_id: int,
@@ -134,39 +172,31 @@ class BacktestHistoryRepository:
         return result.scalar_one_or_none()
 
     async def get_user_stats(self, user_id: int) -> dict[str, Any]:
-        """Get user's backtest statistics."""
+        """Get user's backtest statistics, aggregated in a single SQL query."""
         result = await self.session.execute(
-            select(BacktestHistory).where(
+            select(
+                func.count().label("total_backtests"),
+                func.array_agg(func.distinct(BacktestHistory.strategy)).label(
+                    "strategies_used"
+                ),
+                func.avg(BacktestHistory.total_return).label("avg_return"),
+                func.max(BacktestHistory.total_return).label("best_return"),
+                func.min(BacktestHistory.total_return).label("worst_return"),
+                func.avg(BacktestHistory.sharpe_ratio).label("avg_sharpe"),
+                func.coalesce(func.sum(BacktestHistory.monte_carlo_runs), 0).label(
+                    "total_monte_carlo_runs"
+                ),
+            ).where(
                 and_(
                     BacktestHistory.user_id == user_id,
                     BacktestHistory.status == "completed",
                 )
             )
         )
-        histories = list(result.scalars().all())
-        if not histories:
-            return {
-                "total_backtests": 0,
-                "strategies_used": [],
-                "avg_return": None,
-                "best_return": None,
-                "worst_return": None,
-                "avg_sharpe": None,
-                "total_monte_carlo_runs": 0,
-            }
-        returns = [h.total_return for h in histories if h.total_return is not None]
-        sharpes = [h.sharpe_ratio for h in histories if h.sharpe_ratio is not None]
-        strategies = list(set(h.strategy for h in histories))
-        total_mc_runs = sum(h.monte_carlo_runs for h in histories)
-        return {
-            "total_backtests": len(histories),
-            "strategies_used": strategies,
-            "avg_return": sum(returns) / len(returns) if returns else None,
-            "best_return": max(returns) if returns else None,
-            "worst_return": min(returns) if returns else None,
-            "avg_sharpe": sum(sharpes) / len(sharpes) if sharpes else None,
-            "total_monte_carlo_runs": total_mc_runs,
-        }
+        stats = result.one()._asdict()
+        stats["strategies_used"] = stats["strategies_used"] or []
+        stats["total_monte_carlo_runs"] = int(stats["total_monte_carlo_runs"])
+        return stats
 
     async def delete_history(self, history_id: int, user_id: int) -> bool:
         """Delete a backtest history entry (user can only delete their own)."""
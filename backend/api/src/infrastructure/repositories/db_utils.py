@@ -308,43 +308,47 @@ class BatchOperationManager:
             raise
 
     async def _batch_update_job_status(self, batch: list[dict[str, Any]]):
-        """Execute batch job status updates"""
+        """Execute batch job status updates as one executemany UPDATE by primary key"""
         from sqlalchemy import update
 
         from infrastructure.models import Job
 
-        for job_data in batch:
-            await self.session.execute(
-                update(Job)
-                .where(Job.id == job_data["job_id"])
-                .values(
-                    status=job_data["status"],
-                    updated_at=job_data.get("updated_at"),
-                    worker_id=job_data.get("worker_id"),
-                    error=job_data.get("error"),
-                    progress=job_data.get("progress"),
-                    artifact_url=job_data.get("artifact_url"),
-                    completed_at=job_data.get("completed_at"),
-                )
-            )
+        await self.session.execute(
+            update(Job),
+            [
+                {
+                    "id": job_data["job_id"],
+                    "status": job_data["status"],
+                    "updated_at": job_data.get("updated_at"),
+                    "worker_id": job_data.get("worker_id"),
+                    "error": job_data.get("error"),
+                    "progress": job_data.get("progress"),
+                    "artifact_url": job_data.get("artifact_url"),
+                    "completed_at": job_data.get("completed_at"),
+                }
+                for job_data in batch
+            ],
+        )
         await self.session.commit()
 
     async def _batch_update_job_progress(self, batch: list[dict[str, Any]]):
-        """Execute batch job progress updates"""
+        """Execute batch job progress updates as one executemany UPDATE by primary key"""
         from sqlalchemy import update
 
         from infrastructure.models import Job
 
-        for job_data in batch:
-            await self.session.execute(
-                update(Job)
-                .where(Job.id == job_data["job_id"])
-                .values(
-                    progress=job_data["progress"],
-                    updated_at=job_data.get("updated_at"),
-                    payload=job_data.get("payload"),
-                )
-            )
+        await self.session.execute(
+            update(Job),
+            [
+                {
+                    "id": job_data["job_id"],
+                    "progress": job_data["progress"],
+                    "updated_at": job_data.get("updated_at"),
+                    "payload": job_data.get("payload"),
+                }
+                for job_data in batch
+            ],
+        )
         await self.session.commit()
 
 
@@ -6,13 +6,15 @@ and status tracking in the Monte Carlo queue system.
 
 import base64
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import and_, or_, select, text, update
+from sqlalchemy import and_, bindparam, func, or_, select, text, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.models import Job
+from infrastructure.models import Job, JobPriority
 from infrastructure.repositories.db_utils import (
     BatchOperationManager,
     DatabaseError,
@@ -23,6 +25,49 @@ from infrastructure.repositories.db_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Rows removed per DELETE statement (and transaction) during cleanup.
+CLEANUP_BATCH_SIZE = 1000
+
+# Hot-path statements are built once at import; calls only bind parameters,
+# skipping per-call construction and cache-key generation for the AST.
+_JOB_BY_ID = select(Job).where(Job.id == bindparam("job_id"))
+_JOB_EXISTS = select(Job.id).where(Job.id == bindparam("job_id"))
+_INCREMENT_ATTEMPTS = (
+    update(Job)
+    .where(Job.id == bindparam("job_id"))
+    .values(attempts=Job.attempts + 1, updated_at=func.now())
+)
+_CLAIM_NEXT_JOB = (
+    update(Job)
+    .where(
+        Job.id
+        == select(Job.id)
+        .where(Job.status.in_(("pending", "retry")))
+        .order_by(Job.priority.desc(), Job.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    .values(
+        status="processing",
+        worker_id=bindparam("claimer"),
+        attempts=Job.attempts + 1,
+        started_at=func.now(),
+        updated_at=func.now(),
+    )
+    .returning(Job)
+    .execution_options(synchronize_session=False)
+)
+
+
+def _merged_payload(patch: dict[str, Any]):
+    """SQL expression merging ``patch`` into the stored payload (JSONB ``||``).
+
+    The merge runs inside the UPDATE, so the payload, which can carry a whole
+    base64-encoded CSV, never has to be read into Python first.
+    """
+    return Job.payload.op("||", return_type=JSONB)(type_coerce(patch, JSONB))
+
 
 class JobRepository:
     """Repository for job database operations"""
@@ -97,7 +142,7 @@ class JobRepository:
         job_id: str,
         payload: dict[str, Any],
         status: str = "pending",
-        priority: str = "normal",
+        priority: int = JobPriority.NORMAL,
         dedup_key: str | None = None,
     ) -> Job:
         """
@@ -149,10 +194,23 @@ class JobRepository:
             )
 
     async def get_job_by_id(self, job_id: str) -> Job | None:
-        """Get job by ID"""
-        result = await self.session.execute(select(Job).where(Job.id == job_id))
+        """Get job by ID (None for ids that are not UUIDs)"""
+        try:
+            UUID(job_id)
+        except ValueError:
+            return None
+        result = await self.session.execute(_JOB_BY_ID, {"job_id": job_id})
         return result.scalar_one_or_none()
 
+    async def job_exists(self, job_id: str) -> bool:
+        """Check whether a job row exists without loading its payload"""
+        try:
+            UUID(job_id)
+        except ValueError:
+            return False
+        result = await self.session.execute(_JOB_EXISTS, {"job_id": job_id})
+        return result.scalar_one_or_none() is not None
+
     async def get_job_by_dedup_key(self, dedup_key: str) -> Job | None:
         """Get job by deduplication key"""
         result = await self.session.execute(
@@ -234,22 +292,20 @@ class JobRepository:
         """
         try:
             progress = max(0.0, min(1.0, progress))
-            update_data = {"progress": progress, "updated_at": datetime.utcnow()}
+            update_data = {"progress": progress, "updated_at": func.now()}
             if started_at is not None:
                 update_data["started_at"] = started_at
             if completed_at is not None:
                 update_data["completed_at"] = completed_at
-            result = await self.session.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
-            if job:
-                payload = job.payload.copy() if job.payload else {}
-                if message:
-                    payload["progress_message"] = message
-                if current_run is not None:
-                    payload["current_run"] = current_run
-                if total_runs is not None:
-                    payload["total_runs"] = total_runs
-                update_data["payload"] = payload
+            payload_patch: dict[str, Any] = {}
+            if message:
+                payload_patch["progress_message"] = message
+            if current_run is not None:
+                payload_patch["current_run"] = current_run
+            if total_runs is not None:
+                payload_patch["total_runs"] = total_runs
+            if payload_patch:
+                update_data["payload"] = _merged_payload(payload_patch)
             result = await self.session.execute(
                 update(Job).where(Job.id == job_id).values(**update_data)
             )
@@ -288,7 +344,7 @@ class JobRepository:
         """
         async with db_operation_monitor("update_job_status", self.session):
             try:
-                update_data = {"status": status, "updated_at": datetime.utcnow()}
+                update_data = {"status": status, "updated_at": func.now()}
                 if worker_id is not None:
                     update_data["worker_id"] = worker_id
                 if error is not None:
@@ -338,22 +394,62 @@ class JobRepository:
                 )
                 raise DatabaseError(f"Failed to update job status: {str(e)}") from e
 
+    async def apply_runtime_snapshot(
+        self,
+        job_id: str,
+        status: str,
+        progress: float,
+        payload_patch: dict[str, Any] | None = None,
+        error: str | None = None,
+        started_at: datetime | None = None,
+        completed_at: datetime | None = None,
+    ) -> bool:
+        """
+        Persist a runtime job snapshot in a single UPDATE.
+        Args:
+            job_id: Job identifier
+            status: Job status
+            progress: Progress value (0.0 to 1.0)
+            payload_patch: Keys merged into the stored payload in SQL
+            error: Error message if failed
+            started_at: Job start timestamp
+            completed_at: Job completion timestamp
+        Returns:
+            True if update successful, False otherwise
+        """
+        try:
+            update_data: dict[str, Any] = {
+                "status": status,
+                "progress": max(0.0, min(1.0, progress)),
+                "updated_at": func.now(),
+            }
+            if payload_patch:
+                update_data["payload"] = _merged_payload(payload_patch)
+            if error is not None:
+                update_data["error"] = error
+            if started_at is not None:
+                update_data["started_at"] = started_at
+            if completed_at is not None:
+                update_data["completed_at"] = completed_at
+            result = await self.session.execute(
+                update(Job).where(Job.id == job_id).values(**update_data)
+            )
+            await self.session.commit()
+            return result.rowcount > 0  # pyright: ignore[reportAttributeAccessIssue]
+        except Exception:
+            await self.session.rollback()
+            return False
+
     async def merge_job_payload(self, job_id: str, payload_patch: dict[str, Any]) -> bool:
         """
         Merge a partial payload into the job payload JSON.
         Returns True if job exists and was updated.
         """
         try:
-            result = await self.session.execute(select(Job).where(Job.id == job_id))
-            job = result.scalar_one_or_none()
-            if not job:
-                return False
-            payload = job.payload.copy() if isinstance(job.payload, dict) else {}
-            payload.update(payload_patch)
             update_result = await self.session.execute(
                 update(Job)
                 .where(Job.id == job_id)
-                .values(payload=payload, updated_at=datetime.utcnow())
+                .values(payload=_merged_payload(payload_patch), updated_at=func.now())
             )
             await self.session.commit()
             return bool(update_result.rowcount)  # pyright: ignore[reportAttributeAccessIssue]
@@ -369,14 +465,25 @@ class JobRepository:
         Returns:
             True if job was updated, False if not found
         """
-        result = await self.session.execute(
-            update(Job)
-            .where(Job.id == job_id)
-            .values(attempts=Job.attempts + 1, updated_at=datetime.utcnow())
-        )
+        result = await self.session.execute(_INCREMENT_ATTEMPTS, {"job_id": job_id})
         await self.session.commit()
         return result.rowcount > 0  # pyright: ignore[reportAttributeAccessIssue]
 
+    async def claim_next_job(self, worker_id: str) -> Job | None:
+        """
+        Atomically claim the highest-priority queued job for a worker.
+        Rows locked by concurrent claimers are skipped, so workers never wait
+        on each other; the inner SELECT walks ix_jobs_pending_queue.
+        Args:
+            worker_id: Identifier of the claiming worker
+        Returns:
+            The claimed job, now in processing status, or None if the queue is empty
+        """
+        result = await self.session.execute(_CLAIM_NEXT_JOB, {"claimer": worker_id})
+        job = result.scalar_one_or_none()
+        await self.session.commit()
+        return job
+
     async def list_jobs(
         self,
         status: str | None = None,
@@ -405,35 +512,44 @@ class JobRepository:
 
     async def get_job_counts_by_status_simple(self) -> dict[str, int]:
         """Get count of jobs by status (simple version without caching)"""
-        from sqlalchemy import func
-
         result = await self.session.execute(
             select(Job.status, func.count(Job.id)).group_by(Job.status)
         )
         return {status: count for status, count in result.all()}
 
-    async def cleanup_old_jobs(self, older_than_hours: int = 24) -> int:
+    async def cleanup_old_jobs(
+        self, older_than_hours: int = 24, batch_size: int = CLEANUP_BATCH_SIZE
+    ) -> int:
         """
         Clean up old completed/failed jobs.
+        Rows are deleted in batches of ``batch_size``, committing after each
+        batch so a large backlog never holds row locks in one long transaction.
         Args:
             older_than_hours: Remove jobs older than this many hours
+            batch_size: Maximum number of rows removed per statement
         Returns:
             Number of jobs removed
         """
         from sqlalchemy import delete
 
-        cutoff_time = datetime.utcnow() - timedelta(hours=older_than_hours)
-        result = await self.session.execute(
-            delete(Job).where(
+        cutoff_time = datetime.now(UTC) - timedelta(hours=older_than_hours)
+        batch_ids = (
+            select(Job.id)
+            .where(
                 and_(
                     Job.updated_at < cutoff_time,
-                    or_(
-                        Job.status == "completed",
-                        Job.status == "failed",
-                        Job.status == "cancelled",
-                    ),
+                    Job.status.in_(("completed", "failed", "cancelled")),
                 )
             )
+            .limit(batch_size)
+            .scalar_subquery()
         )
-        await self.session.commit()
-        return result.rowcount  # pyright: ignore[reportAttributeAccessIssue]
+        stmt = delete(Job).where(Job.id.in_(batch_ids))
+        removed = 0
+        while True:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            deleted = result.rowcount  # pyright: ignore[reportAttributeAccessIssue]
+            removed += deleted
+            if deleted < batch_size:
+                return removed
@@ -11,13 +11,18 @@ import os
 from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from multiprocessing import shared_memory
 from typing import Any
 
 import numpy as np
 import pandas as pd
 from numpy.random import Generator, default_rng
 
-from domain.schemas.backtest import EquityEnvelope, MetricsDistribution
+from domain.schemas.backtest import (
+    ENVELOPE_PERCENTILES,
+    EquityEnvelope,
+    MetricsDistribution,
+)
 from services.backtest_service import (
     CsvBytesPriceSeriesSource,
     ServiceBacktestResult,
@@ -28,6 +33,8 @@ from services.backtest_service import (
 logger = logging.getLogger("services.mc_backtest")
 MAX_MONTE_CARLO_RUNS = int(os.getenv("MAX_MONTE_CARLO_RUNS", "20000"))
 DEFAULT_PARALLEL_WORKERS = os.cpu_count() or 1
+# Process-pool tasks submitted per worker; runs are chunked to match.
+MC_TASKS_PER_WORKER = 4
 
 
 @dataclass
@@ -52,6 +59,45 @@ class MonteCarloSummary:
     equity_envelope: EquityEnvelope | None = None
 
 
+@dataclass(frozen=True)
+class SharedCsvRef:
+    """Reference to CSV bytes published in a SharedMemory block"""
+
+    name: str
+    size: int
+
+
+# Prices parsed from the shared CSV block last seen by this process.
+_shared_prices: tuple[tuple[str, str], pd.Series] | None = None
+
+
+def _publish_csv(csv_data: bytes) -> shared_memory.SharedMemory:
+    """Copy CSV bytes into a new SharedMemory block; the caller must unlink it."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(csv_data)))
+    assert shm.buf is not None
+    shm.buf[: len(csv_data)] = csv_data
+    return shm
+
+
+def _load_original_prices(csv_data: bytes | SharedCsvRef, price_type: str) -> pd.Series:
+    """Parse the input price series, once per process for shared CSV blocks."""
+    global _shared_prices
+    if not isinstance(csv_data, SharedCsvRef):
+        return CsvBytesPriceSeriesSource(csv_data, price_type).get_prices()
+    key = (csv_data.name, price_type)
+    if _shared_prices is not None and _shared_prices[0] == key:
+        return _shared_prices[1]
+    shm = shared_memory.SharedMemory(name=csv_data.name)
+    try:
+        assert shm.buf is not None
+        raw = bytes(shm.buf[: csv_data.size])
+    finally:
+        shm.close()
+    prices = CsvBytesPriceSeriesSource(raw, price_type).get_prices()
+    _shared_prices = (key, prices)
+    return prices
+
+
 def bootstrap_returns_to_prices(
     prices: pd.Series,
     sample_fraction: float = 1.0,
@@ -122,7 +168,7 @@ def monte_carlo_worker(args) -> MonteCarloResult | None:
     logger = logging.getLogger("services.mc_backtest_worker")
     try:
         if isinstance(args, dict):
-            csv_data = args.get("csv_data")
+            csv_data: bytes | SharedCsvRef | None = args.get("csv_data")
             df = args.get("df")
             strategy_name = args["strategy_name"]
             strategy_params = args["strategy_params"]
@@ -156,8 +202,9 @@ def monte_carlo_worker(args) -> MonteCarloResult | None:
         if df is not None:
             original_prices = df["close"]
         else:
-            source = CsvBytesPriceSeriesSource(csv_data, price_type)  # pyright: ignore[reportArgumentType]
-            original_prices = source.get_prices()
+            if csv_data is None:
+                raise ValueError("Monte Carlo worker needs csv_data or df")
+            original_prices = _load_original_prices(csv_data, price_type)
         if method == "bootstrap":
             synthetic_prices = bootstrap_returns_to_prices(
                 original_prices,
@@ -235,6 +282,22 @@ def monte_carlo_worker(args) -> MonteCarloResult | None:
         return None
 
 
+def monte_carlo_worker_batch(batch: list) -> list[MonteCarloResult | None]:
+    """
+    Run a chunk of Monte Carlo simulations inside a single process-pool task.
+    Args:
+        batch: List of monte_carlo_worker argument tuples
+    Returns:
+        One MonteCarloResult (or None if that run failed) per input
+    """
+    return [monte_carlo_worker(args) for args in batch]
+
+
+def _batch_size(runs: int, parallel_workers: int) -> int:
+    """Chunk size giving each process a few tasks, for balance and progress."""
+    return max(1, -(-runs // (parallel_workers * MC_TASKS_PER_WORKER)))
+
+
 def compute_equity_envelope(
     equity_curves: list[pd.Series], timestamps: list[str]
 ) -> EquityEnvelope:
@@ -248,7 +311,7 @@ def compute_equity_envelope(
     """
     if not equity_curves:
         return EquityEnvelope(
-            timestamps=timestamps, p5=[], p25=[], median=[], p75=[], p95=[]
+            timestamps=timestamps, bands=np.empty((len(ENVELOPE_PERCENTILES), 0))
         )
     cleaned_curves = [curve.dropna() for curve in equity_curves if curve is not None]
     cleaned_curves = [curve for curve in cleaned_curves if not curve.empty]
@@ -264,22 +327,14 @@ def compute_equity_envelope(
             envelope_timestamps = [str(t) for t in aligned.index]
         return EquityEnvelope(
             timestamps=envelope_timestamps,
-            p5=np.percentile(equity_matrix, 5, axis=1).tolist(),
-            p25=np.percentile(equity_matrix, 25, axis=1).tolist(),
-            median=np.percentile(equity_matrix, 50, axis=1).tolist(),
-            p75=np.percentile(equity_matrix, 75, axis=1).tolist(),
-            p95=np.percentile(equity_matrix, 95, axis=1).tolist(),
+            bands=np.percentile(equity_matrix, ENVELOPE_PERCENTILES, axis=1),
         )
     min_length = min(len(curve) for curve in equity_curves)
     aligned_curves = [curve.iloc[:min_length].values for curve in equity_curves]
     equity_matrix = np.array(aligned_curves)
     return EquityEnvelope(
         timestamps=timestamps[:min_length],
-        p5=np.percentile(equity_matrix, 5, axis=0).tolist(),
-        p25=np.percentile(equity_matrix, 25, axis=0).tolist(),
-        median=np.percentile(equity_matrix, 50, axis=0).tolist(),
-        p75=np.percentile(equity_matrix, 75, axis=0).tolist(),
-        p95=np.percentile(equity_matrix, 95, axis=0).tolist(),
+        bands=np.percentile(equity_matrix, ENVELOPE_PERCENTILES, axis=0),
     )
 
 
@@ -308,13 +363,19 @@ def run_monte_carlo_on_df(
         method_params = {}
     logger.info(f"Starting Monte Carlo simulation: {runs} runs, method={method}")
     use_parallel = runs > 1 and parallel_workers > 1
+    # Process-pool workers read the CSV from shared memory instead of having
+    # it pickled into every task.
+    shared_csv = _publish_csv(csv_data) if use_parallel else None
+    csv_arg: bytes | SharedCsvRef = (
+        SharedCsvRef(shared_csv.name, len(csv_data)) if shared_csv else csv_data
+    )
     worker_args = []
     rng = default_rng(seed)
     for _i in range(runs):
         worker_seed = rng.integers(0, 2**32 - 1)
         worker_args.append(
             (
-                csv_data,
+                csv_arg,
                 strategy_name,
                 strategy_params,
                 method,
@@ -333,11 +394,11 @@ def run_monte_carlo_on_df(
     last_progress_time = time.time()
     last_reported_progress = 0
 
-    def update_progress():
+    def update_progress(count: int = 1):
         """Thread-safe progress update with more frequent reporting"""
         nonlocal completed_runs, last_progress_time, last_reported_progress
         with progress_lock:
-            completed_runs += 1
+            completed_runs += count
             current_time = time.time()
             current_progress = completed_runs / runs if runs > 0 else 0
             time_elapsed = current_time - last_progress_time
@@ -353,18 +414,26 @@ def run_monte_carlo_on_df(
     if use_parallel:
         logger.info(f"Using {parallel_workers} parallel workers")
         try:
+            batch_size = _batch_size(runs, parallel_workers)
             with ProcessPoolExecutor(max_workers=parallel_workers) as executor:
-                future_to_idx = {
-                    executor.submit(monte_carlo_worker, args): i
-                    for i, args in enumerate(worker_args)
-                }
-                for future in as_completed(future_to_idx):
-                    result = future.result()
-                    if result is not None:
-                        results.append(result)
-                        successful_runs += 1
-                    update_progress()
+                futures = [
+                    executor.submit(
+                        monte_carlo_worker_batch,
+                        worker_args[start : start + batch_size],
+                    )
+                    for start in range(0, len(worker_args), batch_size)
+                ]
+                for future in as_completed(futures):
+                    batch_results = future.result()
+                    for result in batch_results:
+                        if result is not None:
+                            results.append(result)
+                            successful_runs += 1
+                    update_progress(len(batch_results))
         finally:
+            if shared_csv is not None:
+                shared_csv.close()
+                shared_csv.unlink()
             logger.info("Parallel processing finished.")
     else:
         logger.info("Using sequential processing")
@@ -383,23 +452,10 @@ def run_monte_carlo_on_df(
     sharpe_values = [r.sharpe for r in results]
     drawdown_values = [r.drawdown for r in results]
 
-    def create_metrics_distribution(values: list[float]) -> MetricsDistribution:
-        """Create MetricsDistribution from list of values"""
-        arr = np.array(values)
-        return MetricsDistribution(
-            mean=float(np.mean(arr)),
-            std=float(np.std(arr)),
-            p5=float(np.percentile(arr, 5)),
-            p25=float(np.percentile(arr, 25)),
-            median=float(np.percentile(arr, 50)),
-            p75=float(np.percentile(arr, 75)),
-            p95=float(np.percentile(arr, 95)),
-        )
-
     metrics_distribution = {
-        "pnl": create_metrics_distribution(pnl_values),
-        "sharpe": create_metrics_distribution(sharpe_values),
-        "drawdown": create_metrics_distribution(drawdown_values),
+        "pnl": MetricsDistribution.from_values(pnl_values),
+        "sharpe": MetricsDistribution.from_values(sharpe_values),
+        "drawdown": MetricsDistribution.from_values(drawdown_values),
     }
     equity_envelope = None
     if include_equity_envelope and results and results[0].equity_curve is not None:
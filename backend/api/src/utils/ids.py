@@ -0,0 +1,19 @@
+"""
+Identifier helpers shared by the job table and the in-process worker.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7_int() -> int:
+    """Time-ordered UUID (RFC 9562 v7) as a 128-bit integer"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76
+    return value & ~(0x3 << 62) | 0x2 << 62
+
+
+def uuid7() -> str:
+    """Time-ordered UUID string, so new job ids append to the primary key B-tree"""
+    return str(uuid.UUID(int=uuid7_int()))
@@ -5,85 +5,131 @@ in the same process as the main backend, without requiring external queue system
 """
 
 import logging
+import math
+import os
 import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from uuid import uuid4
+from enum import IntEnum
+from typing import NamedTuple
+from uuid import UUID
 
 from core.logging import JOB_ID
 from services.mc_backtest_service import DEFAULT_PARALLEL_WORKERS, run_monte_carlo_on_df
+from utils.ids import uuid7_int
 
 logger = logging.getLogger(__name__)
 
 
-def _serialize_metric(dist) -> dict:
-    return {
-        "mean": dist.mean,
-        "std": dist.std,
-        "p5": dist.p5,
-        "p25": dist.p25,
-        "median": dist.median,
-        "p75": dist.p75,
-        "p95": dist.p95,
-    }
+class JobStatus(IntEnum):
+    """Lifecycle states of an in-process job; finished states sort last."""
 
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    CANCELLED = 4
 
-def _normalize_envelope(envelope: object) -> None:
-    for key in ["p5", "p25", "median", "p75", "p95"]:
-        series = getattr(envelope, key, None)
-        if not series or series[0] == 0:
-            continue
-        first_value = series[0]
-        setattr(envelope, key, [value / first_value for value in series])
 
+# Wire names indexed by JobStatus value.
+_STATUS_NAMES = ("pending", "running", "completed", "failed", "cancelled")
+# Smallest progress change worth storing; finer updates are dropped.
+PROGRESS_STEP = 0.01
+# Smoothing factor for the average job duration.
+STATS_EWMA_ALPHA = 0.2
+# Time constant of the decaying completion rate behind throughput_per_minute.
+THROUGHPUT_WINDOW_MINUTES = 5.0
 
+
+class WorkerStats(NamedTuple):
+    """Point-in-time worker statistics; use ``_asdict()`` at JSON boundaries."""
+
+    total_jobs: int
+    pending: int
+    running: int
+    completed: int
+    failed: int
+    cancelled: int
+    in_flight: int
+    throughput_per_minute: float
+    avg_processing_seconds: float
+    max_concurrent_jobs: int
+    max_in_flight: int
+
+
+class WorkerSaturatedError(RuntimeError):
+    """Raised when a submission would exceed the worker's in-flight limit."""
+
+
+def _job_key(job_id: str) -> int | None:
+    """Map an API job id back to the integer key used by the worker's job table."""
+    try:
+        return UUID(job_id).int
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class SimpleMonteCarloJob:
     """Simple job representation for the sideloaded worker."""
 
-    def __init__(
-        self,
-        job_id: str,
-        csv_data: bytes,
-        filename: str,
-        strategy_name: str,
-        strategy_params: dict,
-        runs: int,
-        method: str = "bootstrap",
-        method_params: dict | None = None,
-        price_type: str = "close",
-        normalize: bool = False,
-        callback: Callable[[str, dict], None] | None = None,
-    ):
-        self.job_id = job_id
-        self.csv_data = csv_data
-        self.filename = filename
-        self.strategy_name = strategy_name
-        self.strategy_params = strategy_params
-        self.runs = runs
-        self.method = method
-        self.method_params = method_params or {}
-        self.price_type = price_type
-        self.normalize = normalize
-        self.callback = callback
-        self.status: str = "pending"
-        self.progress: float = 0.0
-        self.result: dict | None = None
-        self.error: str | None = None
-        self.created_at: datetime = datetime.now(UTC)
-        self.started_at: datetime | None = None
-        self.completed_at: datetime | None = None
+    job_key: int
+    csv_data: bytes
+    filename: str
+    strategy_name: str
+    strategy_params: dict
+    runs: int
+    method: str = "bootstrap"
+    method_params: dict = field(default_factory=dict)
+    price_type: str = "close"
+    normalize: bool = False
+    callback: Callable[[str, dict], None] | None = None
+    job_id: str = field(init=False)
+    status: JobStatus = JobStatus.PENDING
+    progress: float = 0.0
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        self.job_id = str(UUID(int=self.job_key))
+
+    def update_progress(self, progress: float) -> bool:
+        """Store clamped progress; returns False if the step was too small to keep."""
+        p = 0.0 if progress < 0.0 else 1.0 if progress > 1.0 else progress
+        if p < 1.0 and p - self.progress < PROGRESS_STEP:
+            return False
+        self.progress = p
+        return True
 
 
 class SimpleMonteCarloWorker:
     """Simple Monte Carlo worker that runs in the same process without external dependencies."""
 
-    def __init__(self, max_concurrent_jobs: int = 2):
+    def __init__(self, max_concurrent_jobs: int = 2, max_in_flight: int = 0):
+        """
+        Args:
+            max_concurrent_jobs: Number of jobs executed at the same time
+            max_in_flight: Cap on pending + running jobs; 0 means unbounded
+        """
         self.max_concurrent_jobs = max_concurrent_jobs
-        self.jobs: dict[str, SimpleMonteCarloJob] = {}
+        self.max_in_flight = max_in_flight
+        self.jobs: dict[int, SimpleMonteCarloJob] = {}
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent_jobs)
         self._lock = threading.Lock()
+        self._in_flight = 0
+        # Maintained on every transition so get_stats never scans the job table.
+        self._status_counts = [0] * len(JobStatus)
+        self._finished_total = 0
+        # Exponentially decayed completions per minute, as of _rate_updated_ns.
+        self._throughput_rate = 0.0
+        self._rate_updated_ns = time.monotonic_ns()
+        self._duration_ewma = 0.0
 
     def submit_job(
         self,
@@ -98,36 +144,48 @@ class SimpleMonteCarloWorker:
         normalize: bool = False,
         callback: Callable[[str, dict], None] | None = None,
     ) -> str:
-        """Submit a new Monte Carlo job for asynchronous execution."""
-        job_id = str(uuid4())
+        """
+        Submit a new Monte Carlo job for asynchronous execution.
+        Raises:
+            WorkerSaturatedError: If max_in_flight jobs are already pending or running
+        """
         job = SimpleMonteCarloJob(
-            job_id=job_id,
+            job_key=uuid7_int(),
             csv_data=csv_data,
             filename=filename,
             strategy_name=strategy_name,
             strategy_params=strategy_params,
             runs=runs,
             method=method,
-            method_params=method_params,
+            method_params=method_params or {},
             price_type=price_type,
             normalize=normalize,
             callback=callback,
         )
         with self._lock:
-            self.jobs[job_id] = job
+            if self.max_in_flight and self._in_flight >= self.max_in_flight:
+                raise WorkerSaturatedError(
+                    f"Worker is at capacity ({self.max_in_flight} jobs in flight)"
+                )
+            self._in_flight += 1
+            self._status_counts[JobStatus.PENDING] += 1
+            self.jobs[job.job_key] = job
         self.executor.submit(self._execute_job, job)
-        logger.info(f"Submitted Monte Carlo job {job_id} with {runs} runs")
-        return job_id
+        logger.info(f"Submitted Monte Carlo job {job.job_id} with {runs} runs")
+        return job.job_id
 
     def get_job_status(self, job_id: str) -> dict | None:
         """Get the status of a job."""
+        key = _job_key(job_id)
+        if key is None:
+            return None
         with self._lock:
-            job = self.jobs.get(job_id)
+            job = self.jobs.get(key)
             if not job:
                 return None
             return {
-                "job_id": job_id,
-                "status": job.status,
+                "job_id": job.job_id,
+                "status": _STATUS_NAMES[job.status],
                 "progress": job.progress,
                 "created_at": job.created_at.isoformat(),
                 "started_at": job.started_at.isoformat() if job.started_at else None,
@@ -148,7 +206,7 @@ class SimpleMonteCarloWorker:
         return [
             {
                 "job_id": job.job_id,
-                "status": job.status,
+                "status": _STATUS_NAMES[job.status],
                 "progress": job.progress,
                 "created_at": job.created_at.isoformat(),
                 "started_at": job.started_at.isoformat() if job.started_at else None,
@@ -164,13 +222,16 @@ class SimpleMonteCarloWorker:
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a job (limited capability - can only mark as cancelled)."""
+        key = _job_key(job_id)
+        if key is None:
+            return False
         with self._lock:
-            job = self.jobs.get(job_id)
+            job = self.jobs.get(key)
             if not job:
                 return False
-            if job.status in ["completed", "failed", "cancelled"]:
+            if job.status >= JobStatus.COMPLETED:
                 return False
-            job.status = "cancelled"
+            self._set_status(job, JobStatus.CANCELLED)
             job.completed_at = datetime.now(UTC)
             return True
 
@@ -179,49 +240,87 @@ class SimpleMonteCarloWorker:
         cutoff_time = datetime.now(UTC).timestamp() - (max_age_hours * 3600)
         removed_count = 0
         with self._lock:
-            job_ids_to_remove = []
-            for job_id, job in self.jobs.items():
+            job_keys_to_remove = []
+            for job_key, job in self.jobs.items():
                 if (
-                    job.status in ["completed", "failed", "cancelled"]
+                    job.status >= JobStatus.COMPLETED
                     and job.completed_at
                     and job.completed_at.timestamp() < cutoff_time
                 ):
-                    job_ids_to_remove.append(job_id)
-            for job_id in job_ids_to_remove:
-                del self.jobs[job_id]
+                    job_keys_to_remove.append(job_key)
+            for job_key in job_keys_to_remove:
+                self._status_counts[self.jobs.pop(job_key).status] -= 1
                 removed_count += 1
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old jobs")
         return removed_count
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> WorkerStats:
         """Get worker statistics."""
         with self._lock:
-            jobs = list(self.jobs.values())
-        stats = {
-            "total_jobs": len(jobs),
-            "pending": sum(1 for j in jobs if j.status == "pending"),
-            "running": sum(1 for j in jobs if j.status == "running"),
-            "completed": sum(1 for j in jobs if j.status == "completed"),
-            "failed": sum(1 for j in jobs if j.status == "failed"),
-            "cancelled": sum(1 for j in jobs if j.status == "cancelled"),
-            "max_concurrent_jobs": self.max_concurrent_jobs,
-        }
-        return stats
+            counts = self._status_counts
+            return WorkerStats(
+                total_jobs=len(self.jobs),
+                pending=counts[JobStatus.PENDING],
+                running=counts[JobStatus.RUNNING],
+                completed=counts[JobStatus.COMPLETED],
+                failed=counts[JobStatus.FAILED],
+                cancelled=counts[JobStatus.CANCELLED],
+                in_flight=self._in_flight,
+                throughput_per_minute=round(
+                    self._decayed_throughput(time.monotonic_ns()), 3
+                ),
+                avg_processing_seconds=round(self._duration_ewma, 3),
+                max_concurrent_jobs=self.max_concurrent_jobs,
+                max_in_flight=self.max_in_flight,
+            )
+
+    def _set_status(self, job: SimpleMonteCarloJob, status: JobStatus) -> None:
+        """Move a job to a new status, keeping the counters in step (lock held)."""
+        self._status_counts[job.status] -= 1
+        self._status_counts[status] += 1
+        job.status = status
+
+    def _decayed_throughput(self, now_ns: int) -> float:
+        """Completion rate decayed to ``now_ns``, so it falls off while idle (lock held)."""
+        elapsed_minutes = (now_ns - self._rate_updated_ns) / 60e9
+        return self._throughput_rate * math.exp(
+            -elapsed_minutes / THROUGHPUT_WINDOW_MINUTES
+        )
+
+    def _record_finish(self, job: SimpleMonteCarloJob) -> None:
+        """Count a finished job in the throughput rate and duration EWMA (lock held)."""
+        now_ns = time.monotonic_ns()
+        # Each completion adds 1/tau, so the rate tracks completions per minute
+        # over roughly the last THROUGHPUT_WINDOW_MINUTES, bursts included.
+        self._throughput_rate = (
+            self._decayed_throughput(now_ns) + 1.0 / THROUGHPUT_WINDOW_MINUTES
+        )
+        self._rate_updated_ns = now_ns
+        if job.started_at and job.completed_at:
+            duration = (job.completed_at - job.started_at).total_seconds()
+            if self._finished_total == 0:
+                self._duration_ewma = duration
+            else:
+                self._duration_ewma += STATS_EWMA_ALPHA * (
+                    duration - self._duration_ewma
+                )
+        self._finished_total += 1
 
     def _execute_job(self, job: SimpleMonteCarloJob) -> None:
         """Execute a Monte Carlo job in a thread."""
         token = JOB_ID.set(job.job_id)
         try:
             with self._lock:
-                job.status = "running"
+                self._set_status(job, JobStatus.RUNNING)
                 job.started_at = datetime.now(UTC)
             logger.info(f"Starting execution of job {job.job_id}")
 
             def progress_callback(processed: int, total: int):
                 progress = processed / total if total > 0 else 0.0
                 with self._lock:
-                    job.progress = progress
+                    if not job.update_progress(progress):
+                        return
                 logger.debug(f"Job {job.job_id} progress: {progress:.1%}")
 
             result = run_monte_carlo_on_df(
@@ -239,31 +338,25 @@ class SimpleMonteCarloWorker:
                 progress_callback=progress_callback,
             )
             if job.normalize and result.equity_envelope:
-                _normalize_envelope(result.equity_envelope)
+                result.equity_envelope = result.equity_envelope.normalized()
             result_dict = {
                 "filename": result.filename,
                 "method": result.method,
                 "runs": result.runs,
                 "successful_runs": result.successful_runs,
                 "metrics_distribution": {
-                    key: _serialize_metric(dist)
+                    key: dist.as_named_dict()
                     for key, dist in result.metrics_distribution.items()
                 },
             }
             if result.equity_envelope:
-                result_dict["equity_envelope"] = {
-                    "timestamps": result.equity_envelope.timestamps,
-                    "p5": result.equity_envelope.p5,
-                    "p25": result.equity_envelope.p25,
-                    "median": result.equity_envelope.median,
-                    "p75": result.equity_envelope.p75,
-                    "p95": result.equity_envelope.p95,
-                }
+                result_dict["equity_envelope"] = result.equity_envelope.model_dump()
             with self._lock:
-                job.status = "completed"
+                self._set_status(job, JobStatus.COMPLETED)
                 job.progress = 1.0
                 job.result = result_dict
                 job.completed_at = datetime.now(UTC)
+                self._record_finish(job)
             logger.info(
                 f"Job {job.job_id} completed successfully: {result.successful_runs}/{result.runs} runs"
             )
@@ -278,9 +371,10 @@ class SimpleMonteCarloWorker:
             error_msg = f"Job execution failed: {str(e)}"
             logger.error(f"Job {job.job_id} failed: {error_msg}", exc_info=True)
             with self._lock:
-                job.status = "failed"
+                self._set_status(job, JobStatus.FAILED)
                 job.error = error_msg
                 job.completed_at = datetime.now(UTC)
+                self._record_finish(job)
             if job.callback:
                 try:
                     job.callback(job.job_id, {"error": error_msg})
@@ -289,6 +383,8 @@ class SimpleMonteCarloWorker:
                         f"Error callback failed for job {job.job_id}: {callback_error}"
                     )
         finally:
+            with self._lock:
+                self._in_flight -= 1
             JOB_ID.reset(token)
 
     def shutdown(self):
@@ -304,7 +400,10 @@ def get_simple_worker() -> SimpleMonteCarloWorker:
     """Get the global simple worker instance."""
     global _worker_instance
     if _worker_instance is None:
-        _worker_instance = SimpleMonteCarloWorker(max_concurrent_jobs=2)
+        _worker_instance = SimpleMonteCarloWorker(
+            max_concurrent_jobs=2,
+            max_in_flight=int(os.getenv("MC_MAX_IN_FLIGHT_JOBS", "32")),
+        )
         logger.info("Initialized simple Monte Carlo worker")
     return _worker_instance
 
@@ -3,6 +3,7 @@ Configuration globale pour les tests avec mocking des services AWS.
 """
 
 import json
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -172,7 +173,7 @@ def mock_database_dependencies():
                     total_return=0.15,
                     sharpe_ratio=1.2,
                     max_drawdown=-0.08,
-                    created_at="2024-01-01T00:00:00Z",
+                    created_at=datetime(2024, 1, 1, tzinfo=UTC),
                 )
             ]
         )
@@ -241,14 +242,14 @@ def mock_history_entry():
         total_return=15.5,
         sharpe_ratio=1.2,
         max_drawdown=-0.08,
-        created_at="2024-01-01T00:00:00Z",
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
         user_id=1,
         status="completed",
-        start_date="2023-01-01",
-        end_date="2023-12-31",
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 12, 31),
         initial_capital=10000.0,
         num_runs=100,
-        completed_at="2024-01-01T01:00:00Z",
+        completed_at=datetime(2024, 1, 1, 1, tzinfo=UTC),
         total_trades=10,
         execution_time_seconds=60.0,
         metrics=["return", "sharpe_ratio"],
@@ -27,6 +27,7 @@ def test_backtest_ok_200():
         and "sharpe" in body
     )
     assert len(body["equity_curve"]) == 6
+    assert body["kind"] == "single"
 
 
 def test_backtest_invalid_params_400():
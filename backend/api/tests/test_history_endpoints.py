@@ -35,9 +35,8 @@ class TestHistoryEndpoints:
 
         # Mock history repository
         mock_history_repo = Mock()
-        mock_history_repo.count_user_history = AsyncMock(return_value=1)
-        mock_history_repo.get_user_history = AsyncMock(
-            return_value=[mock_history_entry]
+        mock_history_repo.get_user_history_page = AsyncMock(
+            return_value=([mock_history_entry], 1)
         )
         app.dependency_overrides[get_history_repo] = lambda: mock_history_repo
 
@@ -60,7 +59,7 @@ class TestHistoryEndpoints:
 
             # Verify repository calls
             mock_user_repo.get_by_id.assert_called_once_with(1)
-            mock_history_repo.get_user_history.assert_called_once()
+            mock_history_repo.get_user_history_page.assert_called_once()
         finally:
             # Clean up dependency override
             app.dependency_overrides.clear()
@@ -146,6 +145,8 @@ class TestHistoryEndpoints:
             data = response.json()
             assert data["id"] == mock_history_entry.id
             assert data["strategy"] == mock_history_entry.strategy
+            assert data["start_date"] == "2023-01-01"
+            assert data["end_date"] == "2023-12-31"
 
             # Verify repository calls
             mock_user_repo.get_by_id.assert_called_once_with(1)
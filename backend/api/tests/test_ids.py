@@ -0,0 +1,11 @@
+from uuid import UUID
+
+from utils.ids import uuid7, uuid7_int
+
+
+def test_uuid7_is_version_7_and_time_ordered():
+    first = UUID(uuid7())
+    second = UUID(int=uuid7_int())
+    assert first.version == second.version == 7
+    assert first.variant == second.variant == "specified in RFC 4122"
+    assert first.int >> 80 <= second.int >> 80
@@ -0,0 +1,37 @@
+import ast
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+VERSIONS_DIR = SRC_DIR / "infrastructure" / "migrations" / "versions"
+
+
+def _revisions() -> dict[str, tuple[str, str | None]]:
+    """Map each migration file to its (revision, down_revision) literals."""
+    found = {}
+    for path in sorted(VERSIONS_DIR.glob("*.py")):
+        values = {}
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target = node.targets[0]
+                if isinstance(target, ast.Name) and target.id in {
+                    "revision",
+                    "down_revision",
+                }:
+                    values[target.id] = ast.literal_eval(node.value)
+        found[path.name] = (values["revision"], values.get("down_revision"))
+    return found
+
+
+def test_migration_revisions_are_unique():
+    revisions = [rev for rev, _ in _revisions().values()]
+    duplicates = {rev for rev in revisions if revisions.count(rev) > 1}
+    assert not duplicates, f"Duplicate Alembic revisions: {sorted(duplicates)}"
+
+
+def test_migration_chain_is_linear():
+    chain = _revisions().values()
+    revisions = {rev for rev, _ in chain}
+    parents = [down for _, down in chain]
+    assert parents.count(None) == 1, "Expected exactly one base migration"
+    assert all(down is None or down in revisions for down in parents)
+    assert len(set(parents)) == len(parents), "Migration history branches"
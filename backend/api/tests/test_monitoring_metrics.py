@@ -0,0 +1,167 @@
+import asyncio
+import gc
+import threading
+import time
+
+from infrastructure.monitoring.metrics import (
+    HealthChecker,
+    MetricsCollector,
+    PerformanceTracker,
+    freeze_tags,
+    series_key,
+    ttl_cached,
+)
+
+
+def test_metric_points_share_interned_tags():
+    collector = MetricsCollector()
+    collector.record_metric("latency", 1.0, {"path": "/a", "method": "GET"})
+    collector.record_metric("latency", 2.0, {"method": "GET", "path": "/a"})
+
+    points = collector.get_metric_points("latency", {"path": "/a", "method": "GET"})
+    assert [p.value for p in points] == [1.0, 2.0]
+    assert points[0].tags is points[1].tags
+    assert points[0].tags == frozenset({("path", "/a"), ("method", "GET")})
+    assert freeze_tags(None) == frozenset()
+
+
+def test_health_checks_run_concurrently_with_timeout():
+    checker = HealthChecker(check_timeout=0.5)
+
+    async def slow_ok():
+        await asyncio.sleep(0.2)
+        return "healthy", "ok"
+
+    async def hangs():
+        await asyncio.sleep(10)
+
+    checker.register_health_check("a", slow_ok)
+    checker.register_health_check("b", slow_ok)
+    checker.register_health_check("sync", lambda: True)
+    checker.register_health_check("hangs", hangs)
+
+    start = time.perf_counter()
+    results = asyncio.run(checker.run_all_health_checks())
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == ["a", "b", "sync", "hangs"]
+    assert results["a"].status == results["b"].status == "healthy"
+    assert results["sync"].status == "healthy"
+    assert results["hangs"].status == "unhealthy"
+    assert "timed out" in results["hangs"].message
+    assert elapsed < 1.0
+
+
+def test_health_check_results_are_cached_within_ttl():
+    checker = HealthChecker(max_age_ms=60_000)
+    calls = {"cached": 0, "fresh": 0}
+
+    def cached():
+        calls["cached"] += 1
+        return True
+
+    def fresh():
+        calls["fresh"] += 1
+        return True
+
+    checker.register_health_check("cached", cached)
+    checker.register_health_check("fresh", fresh, ttl_ms=0)
+
+    async def poll():
+        for _ in range(3):
+            await checker.run_all_health_checks()
+
+    asyncio.run(poll())
+    assert calls == {"cached": 1, "fresh": 3}
+
+    snapshot = checker.get_all_last_results()
+    asyncio.run(checker.run_health_check("fresh"))
+    assert checker.get_all_last_results()["fresh"] is not snapshot["fresh"]
+    assert checker.get_last_result("cached") is snapshot["cached"]
+
+
+def test_sharded_collector_counts_across_threads():
+    collector = MetricsCollector()
+
+    def produce(worker: int):
+        for _ in range(500):
+            collector.increment_counter("jobs", {"worker": str(worker % 4)})
+
+    threads = [threading.Thread(target=produce, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for w in range(4):
+        assert collector.get_counter_value("jobs", {"worker": str(w)}) == 1000.0
+    assert len(collector.get_all_metrics()) == 4
+    collector.clear_metrics()
+    assert collector.get_all_metrics() == {}
+
+
+def test_buffered_metrics_are_visible_to_readers():
+    collector = MetricsCollector()
+    below = collector.FLUSH_THRESHOLD - 1
+
+    def produce(worker: int):
+        for i in range(below):
+            collector.record_metric("lat", float(i), {"worker": str(worker)})
+
+    threads = [threading.Thread(target=produce, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for w in range(4):
+        points = collector.get_metric_points("lat", {"worker": str(w)})
+        assert [p.value for p in points] == [float(i) for i in range(below)]
+
+    collector.record_timing("op", 1.5)
+    assert "op.duration_ms" in collector.get_all_metrics()
+
+
+def test_exited_thread_buffers_are_published_and_released():
+    collector = MetricsCollector()
+    thread = threading.Thread(target=collector.record_metric, args=("gone", 7.0))
+    thread.start()
+    thread.join()
+    del thread
+    gc.collect()
+
+    assert len(collector._buffers) == 0
+    assert [p.value for p in collector.get_metric_points("gone")] == [7.0]
+
+
+def test_series_key_is_order_independent_and_memoized():
+    key = series_key("latency", {"path": "/a", "method": "GET"})
+    assert key == "latency[method=GET,path=/a]"
+    assert series_key("latency", {"method": "GET", "path": "/a"}) is key
+    assert series_key("latency", None) == "latency"
+
+
+def test_performance_tracker_keeps_latest_window():
+    tracker = PerformanceTracker(window_size=4)
+    for duration in (100.0, 4.0, 1.0, 3.0, 2.0):
+        tracker.record_timing("op", duration)
+
+    stats = tracker.get_statistics("op")
+    assert stats["count"] == 4
+    assert stats["min_ms"] == 1.0 and stats["max_ms"] == 4.0
+    assert stats["avg_ms"] == 2.5
+    assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]) == (3.0, 4.0, 4.0)
+    assert tracker.get_statistics("missing")["count"] == 0
+
+
+def test_ttl_cached_reuses_result_until_expiry():
+    calls = []
+
+    @ttl_cached(seconds=0.05)
+    def probe():
+        calls.append(1)
+        return len(calls)
+
+    assert probe() == probe() == 1
+    time.sleep(0.06)
+    assert probe() == 2
@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
+import pytest
 from numpy.random import default_rng
+from pydantic import ValidationError
 
+from domain.schemas.backtest import EquityEnvelope, MetricsDistribution
 from services.backtest_service import ServiceBacktestResult
 from services.mc_backtest_service import (
+    SharedCsvRef,
+    _load_original_prices,
+    _publish_csv,
     bootstrap_returns_to_prices,
     compute_equity_envelope,
     monte_carlo_worker,
@@ -34,6 +41,46 @@ def test_compute_equity_envelope_aligns_on_common_timestamps():
     assert len(envelope.median) == 2
 
 
+def test_equity_envelope_normalized_rescales_each_band_to_first_value():
+    envelope = compute_equity_envelope(
+        [pd.Series([2.0, 3.0]), pd.Series([4.0, 8.0])], ["t0", "t1"]
+    )
+    assert envelope.bands.shape == (5, 2)
+    dumped = envelope.normalized().model_dump()
+    assert set(dumped) == {"timestamps", "p5", "p25", "median", "p75", "p95"}
+    assert all(dumped[band][0] == 1.0 for band in ("p5", "median", "p95"))
+
+
+def test_equity_envelope_rejects_missing_or_misaligned_bands():
+    with pytest.raises(ValidationError, match="Missing equity envelope fields"):
+        EquityEnvelope(timestamps=["a", "b", "c"])  # pyright: ignore[reportCallIssue]
+    with pytest.raises(ValidationError, match="one band column per timestamp"):
+        EquityEnvelope(timestamps=["a"], bands=np.ones((5, 2)))
+    empty = EquityEnvelope(timestamps=["a"], bands=np.empty((5, 0)))
+    assert empty.model_dump()["p5"] == []
+    with pytest.raises(TypeError):
+        hash(empty)
+
+    bands = np.ones((5, 2))
+    EquityEnvelope(timestamps=["a", "b"], bands=bands)
+    bands[0, 0] = 2.0
+
+
+def test_metrics_distribution_from_values_dumps_named_fields():
+    values = [0.1, -0.2, 0.3, 0.05, 0.0]
+    dist = MetricsDistribution.from_values(values)
+    assert dist.stats.shape == (7,)
+    dumped = dist.model_dump()
+    assert dumped == dist.as_named_dict()
+    assert dumped["mean"] == np.mean(values)
+    assert dumped["median"] == np.percentile(values, 50)
+    assert MetricsDistribution(**dumped) == dist
+
+    stats = dist.stats.copy()
+    MetricsDistribution(stats=stats)
+    stats[0] = 1.0
+
+
 def test_monte_carlo_worker_supports_alias_and_passes_initial_capital(monkeypatch):
     captured: dict[str, float | int] = {}
 
@@ -67,3 +114,16 @@ def test_monte_carlo_worker_supports_alias_and_passes_initial_capital(monkeypatc
         "sma_long": 3,
         "initial_capital": 5000.0,
     }
+
+
+def test_shared_csv_ref_resolves_to_same_prices_as_raw_bytes():
+    csv = b"date,close\n2023-01-01,100\n2023-01-02,101\n2023-01-03,102\n"
+    shm = _publish_csv(csv)
+    try:
+        ref = SharedCsvRef(shm.name, len(csv))
+        shared = _load_original_prices(ref, "close")
+        assert shared.equals(_load_original_prices(csv, "close"))
+        assert _load_original_prices(ref, "close") is shared
+    finally:
+        shm.close()
+        shm.unlink()
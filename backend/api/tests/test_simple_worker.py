@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from workers.simple_worker import (
+    SimpleMonteCarloJob,
+    SimpleMonteCarloWorker,
+    WorkerSaturatedError,
+)
+
+
+def test_submit_job_rejects_when_in_flight_limit_is_reached(monkeypatch):
+    release = threading.Event()
+
+    def blocking_run(**kwargs):
+        release.wait(timeout=5)
+        raise RuntimeError("stopped")
+
+    monkeypatch.setattr("workers.simple_worker.run_monte_carlo_on_df", blocking_run)
+    worker = SimpleMonteCarloWorker(max_concurrent_jobs=1, max_in_flight=1)
+    job_args = {
+        "csv_data": b"date,close\n",
+        "filename": "a.csv",
+        "strategy_name": "sma",
+        "strategy_params": {},
+        "runs": 1,
+    }
+    try:
+        worker.submit_job(**job_args)
+        with pytest.raises(WorkerSaturatedError):
+            worker.submit_job(**job_args)
+    finally:
+        release.set()
+        worker.shutdown()
+    stats = worker.get_stats()
+    assert stats.in_flight == 0
+    assert stats.failed == 1
+    assert stats._asdict()["max_in_flight"] == 1
+
+
+def test_job_update_progress_clamps_and_drops_sub_step_updates():
+    job = SimpleMonteCarloJob(
+        job_key=1,
+        csv_data=b"",
+        filename="a.csv",
+        strategy_name="sma",
+        strategy_params={},
+        runs=1,
+    )
+    assert job.update_progress(-0.5) is False
+    assert job.update_progress(0.005) is False
+    assert job.update_progress(0.5) is True
+    assert job.update_progress(2.0) is True
+    assert job.progress == 1.0
+
+
+def test_throughput_counts_bursts_and_decays_while_idle():
+    worker = SimpleMonteCarloWorker(max_concurrent_jobs=1)
+    job = SimpleMonteCarloJob(
+        job_key=1,
+        csv_data=b"",
+        filename="a.csv",
+        strategy_name="sma",
+        strategy_params={},
+        runs=1,
+    )
+    try:
+        with worker._lock:
+            worker._record_finish(job)
+            worker._record_finish(job)
+        assert worker.get_stats().throughput_per_minute == pytest.approx(0.4, abs=0.01)
+
+        worker._rate_updated_ns -= int(60 * 60e9)
+        assert worker.get_stats().throughput_per_minute == 0.0
+    finally:
+        worker.shutdown()
@@ -47,6 +47,7 @@ export interface MonteCarloResult {
 	processing_time?: string;
 }
 export interface MonteCarloResponse {
+	kind?: "monte_carlo";
 	results: MonteCarloResult[];
 	aggregated_metrics: {
 		average_pnl: number;
@@ -57,6 +58,7 @@ export interface MonteCarloResponse {
 	processing_time?: string;
 }
 export type BacktestResponse = {
+	kind?: "single";
 	timestamps: string[];
 	equity_curve: number[];
 	pnl: number;
@@ -80,6 +82,7 @@ export type AggregatedMetrics = {
 	total_files_processed: number;
 };
 export type MultipleBacktestResponse = {
+	kind?: "multi";
 	results: BacktestResult[];
 	aggregated_metrics: AggregatedMetrics;
 };